@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Birthday Bingo command line
+
+A single entry point for every step of the bingo workflow. Each subcommand only
+imports the script it needs, so quick jobs like validating a card file never pay
+for loading reportlab or tkinter.
+
+USAGE:
+------
+    python bingo.py generate -n 20 --maximize-unique
+    python bingo.py pdf bingo_cards.json -t "Birthday Bingo"
+    python bingo.py pipeline -n 500 --json bingo_cards.json
+    python bingo.py score
+    python bingo.py validate bingo_cards.json
+    python bingo.py stats bingo_cards.json
+    python bingo.py watch --seed 420
+    python bingo.py --time validate     # report how long the command took
+
+COMMANDS:
+---------
+generate    Generate a JSON of bingo cards (bingo_card_generator.py)
+pdf         Render a JSON of bingo cards to PDF (bingo_card_pdf_maker.py, needs reportlab)
+pipeline    Generate cards and stream them straight into a PDF, optionally writing
+            the JSON alongside (bingo_card_pdf_maker.py, needs reportlab)
+score       Open the scoring GUI (bingo_card_scorer.py, needs tkinter)
+validate    Check that every card in a JSON has all nine squares filled in
+stats       Print statistics about a deck of cards (bingo_card_stats.py)
+watch       Keep cards and per-page PDFs in sync while editing the question bank
+            (bingo_card_watcher.py)
+
+Arguments after the command name are passed through to that command, so
+`python bingo.py generate --help` shows the generator's own options.
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+
+
+# command name -> (module, function, help). Modules are imported on demand.
+COMMANDS = {
+    'generate': ('bingo_card_generator', 'main', 'Generate a JSON of bingo cards'),
+    'pdf': ('bingo_card_pdf_maker', 'main', 'Render a JSON of bingo cards to PDF'),
+    'pipeline': ('bingo_card_pdf_maker', 'pipeline_main', 'Generate cards straight into a PDF, no JSON needed'),
+    'score': ('bingo_card_scorer', 'main', 'Open the scoring GUI'),
+    'validate': ('bingo', 'validate_main', 'Check a JSON of bingo cards for missing squares'),
+    'stats': ('bingo_card_stats', 'main', 'Print statistics about a deck of cards'),
+    'watch': ('bingo_card_watcher', 'main', 'Keep cards and PDF pages in sync with the question bank'),
+}
+
+
+def validate_main(argv=None):
+    import json
+    import bingo_card_io
+    from bingo_card_generator import POSITIONS
+
+    parser = argparse.ArgumentParser(prog='bingo.py validate',
+                                     description="Check a JSON of bingo cards for missing squares")
+    parser.add_argument('json_file', nargs='?', default='bingo_cards.json',
+                        help='Path to JSON file containing bingo card data')
+    args = parser.parse_args(argv)
+
+    try:
+        cards = bingo_card_io.load_json(args.json_file)
+    except FileNotFoundError:
+        print(f"Error: File '{args.json_file}' not found.")
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON format in '{args.json_file}': {e}")
+        return 1
+    except (OSError, *bingo_card_io.DECOMPRESSION_ERRORS) as e:
+        print(f"Error: Could not decompress '{args.json_file}': {e}")
+        return 1
+
+    problems = []
+    for card_num, card_data in cards.items():
+        for position in POSITIONS:
+            square = card_data.get(position)
+            if not square or not square.get('content'):
+                problems.append(f"Card {card_num} missing required position or content: {position}")
+
+    for problem in problems:
+        print(problem)
+    if problems:
+        print(f"{len(problems)} problem(s) found in {len(cards)} cards.")
+        return 1
+    print(f"All {len(cards)} cards in {args.json_file} are valid.")
+    return 0
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Birthday Bingo: generate, render, score and inspect bingo cards",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<10}{help_text}"
+                                         for name, (_, _, help_text) in COMMANDS.items())
+    )
+    parser.add_argument('--time', action='store_true',
+                        help='Print how long the command took (including imports) to stderr')
+    parser.add_argument('command', choices=COMMANDS, metavar='command',
+                        help='One of: ' + ', '.join(COMMANDS))
+    parser.add_argument('args', nargs=argparse.REMAINDER,
+                        help='Arguments passed through to the command')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    module_name, function_name, _ = COMMANDS[args.command]
+
+    import_start = time.perf_counter()
+    module = sys.modules[__name__] if module_name == 'bingo' else importlib.import_module(module_name)
+    import_elapsed = time.perf_counter() - import_start
+
+    try:
+        status = getattr(module, function_name)(args.args)
+    finally:
+        if args.time:
+            total = time.perf_counter() - _START
+            print(f"[{args.command}] import {import_elapsed:.3f}s, total {total:.3f}s", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
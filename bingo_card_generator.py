@@ -16,6 +16,13 @@ SETUP:
    - Empty lines and whitespace-only lines will be ignored
    - Each card will randomly select 3 prompts from each category (9 total per card)
 
+3. (Optional) Weight prompts with a sidecar file next to a question file, e.g. innocent.weights.json:
+       {"has a pet": 3, "has travelled to at least 10 countries": 0.5}
+   - Prompts not listed have weight 1. A weight of 0 means the prompt is never picked.
+     At least 3 prompts per category must keep a weight above 0.
+   - Handy for favouring prompts that got signed a lot at past events, or toning down hard ones.
+   - Works with --maximize-unique and --derive: weights decide which unused prompts come first.
+
 USAGE:
 ------
 Basic usage (interactive):
@@ -27,15 +34,27 @@ With command line arguments:
     python bingo_generator.py --player-count 8 --maximize-unique
     python bingo_generator.py --questions custom1.txt custom2.txt spicy.txt
     python bingo_generator.py --seed 420
+    python bingo_generator.py --seed 420 --derive --player-count 5000
+    python bingo_generator.py --players guests.txt --history history.json
 
 ARGUMENTS:
 ----------
 -n, --player-count N            Number of bingo cards to generate. If not given, the user will be asked interactively.
 -s, --seed S                    Custom seed, if you want to recreate the cards for some reason. Defaults to None.
 -f, --file                      Filename of the JSON containing all cards for this bingo. Defaults to bingo_cards.json
+                                End it in .gz, .bz2 or .xz (e.g. bingo_cards.json.gz) to compress it, see bingo_card_io.py.
 --maximize-unique               Ensure maximum unique prompts across all cards
                                 (no prompt reuse until all unique prompts are used)
 --questions file1 file2 file3   Source files (3 must be provided). Defaults to [innocent|mild|spicy].txt
+--derive                        Derive every card independently from (seed, card ID, question bank).
+                                Any single card can then be rebuilt without the JSON, see derive_bingo_card().
+                                Combine with --maximize-unique to keep the no-reuse guarantee.
+--history FILE                  Remember which prompts each player got (see bingo_card_history.py) and skip them
+                                at later events while other prompts are left. Created if missing, updated after each run.
+                                Cannot be combined with --derive.
+--players FILE                  With --history: one player name per line, card N goes to the Nth player.
+                                Sets --player-count if that is not given.
+--series NAME                   With --history: record the whole deck under one name (e.g. a yearly party) instead.
 
 OUTPUT:
 -------
@@ -64,9 +83,31 @@ spicy.txt:
 
 import random
 import json
+import hashlib
+import functools
 import argparse
 import pathlib
-import argparse
+
+import bingo_card_history
+import bingo_card_io
+
+POSITIONS = [
+    'top_left',
+    'top_middle',
+    'top_right',
+    'middle_left',
+    'centre',
+    'middle_right',
+    'bottom_left',
+    'bottom_middle',
+    'bottom_right',
+]
+
+DEFAULT_QUESTION_FILES = [
+    pathlib.Path('question_bank/innocent.txt'),
+    pathlib.Path('question_bank/mild.txt'),
+    pathlib.Path('question_bank/spicy.txt'),
+]
 
 def fill_list_from_file(filename):
     output_list = []
@@ -87,43 +128,170 @@ def generate_master_dict(input_files: pathlib.Path):
     
     return master_dict
 
-def generate_bingo_card(master_dict, used_prompts=None):
-    """Generate a bingo card, optionally tracking used prompts for uniqueness"""
+def load_prompt_weights(input_files, master_dict):
+    """Read the optional <category>.weights.json sidecar of each question file.
+
+    Returns {category: WeightedPrompts} for the categories that have one.
+    """
+    samplers = {}
+    for file in input_files:
+        weights_file = file.with_suffix('.weights.json')
+        if not weights_file.exists():
+            continue
+        with open(weights_file, encoding='utf-8') as f:
+            weights = json.load(f)
+        prompts_list = master_dict[file.stem]
+        unknown = set(weights) - set(prompts_list)
+        if unknown:
+            print(f"Warning: {len(unknown)} prompt(s) in {weights_file} are not in {file} and will be ignored.")
+        if any(not isinstance(w, (int, float)) or w < 0 for w in weights.values()):
+            raise ValueError(f"Weights in {weights_file} must be non-negative numbers")
+        samplers[file.stem] = WeightedPrompts(prompts_list, [weights.get(p, 1) for p in prompts_list])
+        # Each card needs 3 prompts from every category, and weight 0 means never picked
+        needed = min(3, len(prompts_list))
+        if len(samplers[file.stem].eligible) < needed:
+            raise ValueError(f"Only {len(samplers[file.stem].eligible)} prompt(s) in {file} have a weight "
+                             f"above 0, but each card needs {needed}")
+    return samplers
+
+class AliasTable:
+    """Vose's alias method: draws index i with probability weights[i] / sum(weights) in O(1)"""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def draw(self, rng=random):
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+class WeightedPrompts:
+    """Weighted draws without replacement from one category's prompts.
+
+    Draws come from a precomputed alias table and are rejected if the prompt was
+    already picked or is excluded (used elsewhere, with --maximize-unique). When
+    rejections pile up the table is rebuilt over the prompts still eligible, so a
+    draw costs O(1) amortised even as the used-prompt set grows.
+    """
+
+    def __init__(self, prompts, weights):
+        self.prompts = prompts
+        self.weights = tuple(weights)
+        self.eligible = [i for i, w in enumerate(self.weights) if w > 0]
+        self._full = self._build(())
+        self._cached = (None, self._full)  # (exclude set, table built without it)
+
+    def _build(self, skip, chosen=()):
+        """Alias table over the eligible prompts not in chosen or any of the skip containers"""
+        indices = [i for i in self.eligible
+                   if i not in chosen and not any(self.prompts[i] in s for s in skip)]
+        if not indices:
+            return None
+        return indices, AliasTable([self.weights[i] for i in indices])
+
+    def sample(self, k, rng=random, exclude=None, seen=None):
+        """Up to k distinct prompts, topping up from the rest when the preferred ones run out.
+
+        Prefers prompts in neither exclude nor seen, then prompts not in seen, then any.
+        seen is what this player got at earlier events (see bingo_card_history.py).
+        """
+        chosen = []
+        if exclude or seen is not None:
+            self._draw_into(chosen, k, rng, exclude, seen)
+        if seen is not None:
+            self._draw_into(chosen, k, rng, None, seen)
+        self._draw_into(chosen, k, rng, None)
+        return [self.prompts[i] for i in chosen]
+
+    def _draw_into(self, chosen, k, rng, exclude, seen=None):
+        table = self._cached[1] if exclude is not None and self._cached[0] is exclude else self._full
+        skip = [s for s in (exclude, seen) if s is not None]
+        budget = 4 * k + 8
+        rebuilt = False
+        while len(chosen) < k and table is not None:
+            indices, alias = table
+            i = indices[alias.draw(rng)]
+            if i not in chosen and not any(self.prompts[i] in s for s in skip):
+                chosen.append(i)
+                continue
+            budget -= 1
+            if budget:
+                continue
+            if not rebuilt and exclude:
+                # Most of the weight is in excluded prompts; drop them for this and later cards
+                table = self._build([exclude])
+                self._cached = (exclude, table)
+            else:
+                # Only this card's picks (and this player's history) are left to avoid
+                table = self._build(skip, chosen)
+            rebuilt = True
+            budget = 4 * k + 8
+
+def _layout_card(card_list, rng=random):
+    """Shuffle the chosen squares and assign them to positions"""
+    rng.shuffle(card_list)
+
+    card = dict.fromkeys(POSITIONS)
+    for index, key in enumerate(card):
+        # Remaining positions stay None if we run out of prompts
+        if index < len(card_list):
+            card[key] = card_list[index]
+    return card
+
+def _pick_prompts(pools, k, rng=random):
+    """Pick k distinct prompts, using up each pool (most preferred first) before the next"""
+    selected_prompts = []
+    for pool in pools:
+        available_prompts = [p for p in pool if p not in selected_prompts]
+        num_to_select = min(k - len(selected_prompts), len(available_prompts))
+        selected_indices = rng.sample(range(len(available_prompts)), k=num_to_select)
+        selected_prompts += [available_prompts[idx] for idx in selected_indices]
+        if len(selected_prompts) == k:
+            break
+    return selected_prompts
+
+def generate_bingo_card(master_dict, used_prompts=None, rng=random, samplers=None, seen=None):
+    """Generate a bingo card, optionally tracking used prompts for uniqueness.
+
+    samplers: optional {category: WeightedPrompts} for categories with prompt weights
+    seen: optional container of prompts this player already had at earlier events,
+          skipped while other prompts are left (see bingo_card_history.py)
+    """
     if used_prompts is None:
         used_prompts = set()
 
-    positions = [
-        'top_left',
-        'top_middle', 
-        'top_right',
-        'middle_left',
-        'centre',
-        'middle_right',
-        'bottom_left',
-        'bottom_middle',
-        'bottom_right',
-    ]
-    
-    card = dict.fromkeys(positions)
     card_list = []
-    
+
     # Get available prompts for each category
     for category, prompts_list in master_dict.items():
-        # Filter out already used prompts if tracking uniqueness
-        available_prompts = [p for p in prompts_list if p not in used_prompts] if used_prompts else prompts_list
-        
-        # If we don't have enough available prompts, use all remaining ones
-        num_to_select = min(3, len(available_prompts))
-        if num_to_select == 0:
-            # If no available prompts, fall back to original list
-            available_prompts = prompts_list
-            num_to_select = min(3, len(available_prompts))
-        
-        # Sample from available prompts
-        selected_indices = random.sample(range(len(available_prompts)), k=num_to_select)
-        
-        for idx in selected_indices:
-            selected_prompt = available_prompts[idx]
+        if samplers and category in samplers:
+            selected_prompts = samplers[category].sample(3, rng, used_prompts, seen)
+        else:
+            # Prefer prompts that are unused (if tracking uniqueness) and new to this player,
+            # then ones new to this player, then reuse whatever is needed to still get 3
+            pools = []
+            if used_prompts or seen is not None:
+                pools.append([p for p in prompts_list
+                              if p not in used_prompts and (seen is None or p not in seen)])
+            if seen is not None:
+                pools.append([p for p in prompts_list if p not in seen])
+            pools.append(prompts_list)
+            selected_prompts = _pick_prompts(pools, min(3, len(prompts_list)), rng)
+
+        for selected_prompt in selected_prompts:
             card_entry = {
                 "content": selected_prompt,
                 "category": category
@@ -134,35 +302,182 @@ def generate_bingo_card(master_dict, used_prompts=None):
             if used_prompts is not None:
                 used_prompts.add(selected_prompt)
     
-    # Shuffle and assign to positions
-    random.shuffle(card_list)
+    return _layout_card(card_list, rng)
 
-    for index, (key, value) in enumerate(card.items()):
-        bingo_square = card_list[index]
-        if index < len(card_list):
-            card[key] = bingo_square
-        else:
-            # Fill remaining positions with None if we run out of prompts
-            card[key] = None
-    
-    return card
-
-def generate_unique_bingo_cards(count, master_dict, maximize_unique_prompts=False, ):
+def generate_unique_bingo_cards(count, master_dict, maximize_unique_prompts=False, samplers=None):
     """Generate multiple bingo cards, optionally maximizing unique prompts across all cards"""
     cards = []
     used_prompts = set() if maximize_unique_prompts else None
     
     for i in range(count):
-        card = generate_bingo_card(master_dict, used_prompts) # one-based indexing
+        card = generate_bingo_card(master_dict, used_prompts, samplers=samplers) # one-based indexing
         cards.append(card)
     
     return cards
 
+def question_bank_hash(master_dict, samplers=None):
+    """Fingerprint of the question bank. Derived cards change whenever any prompt or weight does."""
+    bank = list(master_dict.items())
+    if samplers:
+        bank.append(sorted((category, sampler.weights) for category, sampler in samplers.items()))
+    digest = hashlib.sha256(json.dumps(bank).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def _derived_rng(*key):
+    """A fresh random stream that is a pure function of key"""
+    digest = hashlib.sha256(':'.join(map(str, key)).encode('utf-8')).digest()
+    return random.Random(int.from_bytes(digest[:8], 'big'))
+
+@functools.lru_cache(maxsize=256)
+def _derived_permutation(seed, bank_hash, category, epoch, size, weights=None):
+    """Order in which a category's prompts are dealt out during one pass through the bank.
+
+    With weights this is a weighted random order (Efraimidis-Spirakis keys u ** (1 / w)),
+    so heavier prompts tend to come early; zero-weight prompts are left out.
+    """
+    rng = _derived_rng(seed, bank_hash, category, epoch)
+    if weights is None:
+        order = list(range(size))
+        rng.shuffle(order)
+        return order
+    keys = {i: rng.random() ** (1 / w) for i, w in enumerate(weights) if w > 0}
+    return sorted(keys, key=keys.get, reverse=True)
+
+@functools.lru_cache(maxsize=256)
+def _dealing_order(seed, bank_hash, category, epoch, size, weights=None, per_card=3):
+    """_derived_permutation for one pass, rearranged so the card straddling the end of the
+    previous pass and the start of this one never gets the same prompt twice.
+
+    Prompts at the start that the straddling card already got are swapped with later ones,
+    never with the pass's own last slots (which the next straddling card checks against),
+    so the previous pass's tail is that of its plain permutation and no recursion is needed.
+    A category of 4 prompts can leave no room for the swap; all larger ones always have it.
+    """
+    order = _derived_permutation(seed, bank_hash, category, epoch, size, weights)
+    count = len(order)
+    previous_tail = epoch * count % per_card  # slots the straddling card took from the previous pass
+    if not previous_tail:
+        return order
+    head = per_card - previous_tail
+    tail = (epoch + 1) * count % per_card
+    taken = set(_derived_permutation(seed, bank_hash, category, epoch - 1, size, weights)[count - previous_tail:])
+    order = list(order)
+    for i in range(head):
+        if order[i] in taken:
+            for j in range(head, count - tail):
+                if order[j] not in taken:
+                    order[i], order[j] = order[j], order[i]
+                    break
+    return order
+
+def _derive_unique_prompts(prompts_list, seed, bank_hash, category, card_index, per_card=3, weights=None):
+    """Pick this card's prompts from a category without consulting any other card.
+
+    Card k takes slots 3k, 3k+1, 3k+2 of an endless sequence made of seeded
+    permutations of the category, one per pass (see _dealing_order). Every pass deals
+    each prompt exactly once, so no prompt is dealt twice before all have been dealt,
+    matching --maximize-unique (categories of 4 prompts may occasionally repeat one early).
+    """
+    size = len(prompts_list) if weights is None else sum(1 for w in weights if w > 0)
+    per_card = min(per_card, size)
+    chosen = []
+    slot = card_index * per_card
+    while len(chosen) < per_card:
+        epoch, offset = divmod(slot, size)
+        idx = _dealing_order(seed, bank_hash, category, epoch, len(prompts_list), weights, per_card)[offset]
+        # Only when a category is too small for _dealing_order to avoid it; skip ahead
+        if idx not in chosen:
+            chosen.append(idx)
+        slot += 1
+    return [prompts_list[idx] for idx in chosen]
+
+def derive_bingo_card(master_dict, seed, card_id, maximize_unique_prompts=False, bank_hash=None, samplers=None):
+    """Build card `card_id` (1-based) as a pure function of (seed, card_id, question bank).
+
+    Unlike generate_bingo_card this needs no shared random stream or used-prompt set,
+    so any one card can be rebuilt in O(1) by the PDF maker or the scorer.
+    """
+    if bank_hash is None:
+        bank_hash = question_bank_hash(master_dict, samplers)
+    rng = _derived_rng(seed, card_id, bank_hash)
+
+    if not maximize_unique_prompts:
+        return generate_bingo_card(master_dict, rng=rng, samplers=samplers)
+
+    card_list = []
+    for category, prompts_list in master_dict.items():
+        if not prompts_list:
+            continue
+        weights = samplers[category].weights if samplers and category in samplers else None
+        for prompt in _derive_unique_prompts(prompts_list, seed, bank_hash, category, int(card_id) - 1,
+                                             weights=weights):
+            card_list.append({
+                "content": prompt,
+                "category": category
+            })
+    return _layout_card(card_list, rng)
+
+def derive_bingo_cards(master_dict, seed, card_ids, maximize_unique_prompts=False, samplers=None):
+    """Derive several cards, keyed by card ID like bingo_cards.json"""
+    bank_hash = question_bank_hash(master_dict, samplers)
+    return {str(card_id): derive_bingo_card(master_dict, seed, card_id, maximize_unique_prompts, bank_hash, samplers)
+            for card_id in card_ids}
+
+def iter_bingo_cards(count, master_dict, maximize_unique_prompts=False, seed=None, derive=False, samplers=None,
+                     history=None, players=None):
+    """Yield (card_id, card) for cards 1 to count, one at a time.
+
+    Lets cards flow straight into a consumer (e.g. the PDF maker) without building
+    the whole deck first. derive=True uses derive_bingo_card and needs a seed.
+
+    history: optional bingo_card_history.PromptHistory. Card i goes to players[i - 1]
+    (cards past the end of players have no history); it avoids the prompts that player
+    had before this run, and its prompts are recorded against them.
+    """
+    if derive:
+        if history is not None:
+            raise ValueError("Derived cards cannot depend on prompt history")
+        bank_hash = question_bank_hash(master_dict, samplers)
+        for card_id in range(1, count + 1):
+            yield card_id, derive_bingo_card(master_dict, seed, card_id, maximize_unique_prompts, bank_hash, samplers)
+        return
+
+    random.seed(seed)
+    used_prompts = set() if maximize_unique_prompts else None
+    seen_before = {}
+    for card_id in range(1, count + 1):
+        player = players[card_id - 1] if history is not None and card_id <= len(players) else None
+        if player is None:
+            yield card_id, generate_bingo_card(master_dict, used_prompts, samplers=samplers)
+            continue
+        # Snapshot per player, so cards sharing a series name don't count each other as history
+        if player not in seen_before:
+            seen_before[player] = history.seen(player)
+        card = generate_bingo_card(master_dict, used_prompts, samplers=samplers, seen=seen_before[player])
+        history.record(player, [square['content'] for square in card.values() if square])
+        yield card_id, card
+
+def write_cards_json(cards, filename):
+    """Write (card_id, card) pairs to filename as they pass through, yielding them on.
+
+    The file has the same layout as json.dump(cards_dict, indent=4), but is written
+    card by card so the deck never has to be held in memory.
+    """
+    with bingo_card_io.open_data_file(filename, 'w') as out_file:
+        out_file.write('{')
+        separator = '\n'
+        for card_id, card in cards:
+            card_text = json.dumps(card, indent=4).replace('\n', '\n    ')
+            out_file.write(f'{separator}    {json.dumps(str(card_id))}: {card_text}')
+            separator = ',\n'
+            yield card_id, card
+        out_file.write('\n}' if separator != '\n' else '}')
+
 def count_total_available_prompts(master_dict):
     """Count total number of unique non-empty prompts available"""
     return sum(len(prompts) for prompts in master_dict.values())
 
-def _parse_args():
+def _parse_args(argv=None):
     parser = argparse.ArgumentParser(description="Generates a JSON of inquisitive bingo cards")
    
     parser.add_argument(
@@ -193,9 +508,7 @@ def _parse_args():
         nargs=3,
         type=pathlib.Path,
         metavar=('file1', 'file2', 'file3'),
-        default=[pathlib.Path('question_bank/innocent.txt'),
-                 pathlib.Path('question_bank/mild.txt'),
-                 pathlib.Path('question_bank/spicy.txt')]
+        default=DEFAULT_QUESTION_FILES
     )
 
     parser.add_argument(
@@ -203,10 +516,41 @@ def _parse_args():
         action='store_true',
         help='Ensure maximum unique prompts across all cards (no duplicates until necessary)'
     )
-    return parser.parse_args()
 
-if __name__ == "__main__":
-    args = _parse_args()
+    parser.add_argument(
+        '--derive',
+        action='store_true',
+        help='Derive each card from (seed, card ID, question bank) so any card can be rebuilt on its own'
+    )
+
+    parser.add_argument(
+        '--history',
+        type=pathlib.Path,
+        help='Prompt history file: skip prompts each player got at earlier events, then add this event'
+    )
+
+    recipients = parser.add_mutually_exclusive_group()
+    recipients.add_argument(
+        '--players',
+        type=pathlib.Path,
+        help='Text file with one player name per line; card N goes to the Nth player'
+    )
+    recipients.add_argument(
+        '--series',
+        help='Name under which the whole deck is recorded in --history, instead of per player'
+    )
+    args = parser.parse_args(argv)
+
+    if args.history and args.derive:
+        parser.error('--history cannot be combined with --derive (derived cards only depend on the seed)')
+    if args.history and not (args.players or args.series):
+        parser.error('--history needs --players or --series to know who the cards are for')
+    if args.series and args.player_count is None:
+        parser.error('--series needs --player-count to know how many cards to make')
+    return args
+
+def main(argv=None):
+    args = _parse_args(argv)
 
     filename = args.file
     filename.parent.mkdir(parents=True, exist_ok=True)
@@ -214,8 +558,23 @@ if __name__ == "__main__":
     game_seed = args.seed
     master_files = args.questions
     player_count = args.player_count
-    
+
+    history = players = None
+    if args.history:
+        players = fill_list_from_file(args.players) if args.players else None
+        if player_count is None and players:
+            player_count = len(players)
+        if players is None:
+            players = [args.series] * player_count
+        elif len(players) < player_count:
+            print(f"Warning: only {len(players)} players listed for {player_count} cards; "
+                  f"the rest are not recorded in {args.history}.")
+        history = bingo_card_history.PromptHistory.load(args.history)
+
     master_dict = generate_master_dict(master_files)
+    samplers = load_prompt_weights(master_files, master_dict)
+    for category in samplers:
+        print(f"Using prompt weights for '{category}'.")
     
     # Check if we have enough unique prompts
     total_prompts = count_total_available_prompts(master_dict)
@@ -227,21 +586,21 @@ if __name__ == "__main__":
         print("Some prompts will be reused across cards.")
     
     # Generate cards
-    if args.maximize_unique:
-        cards_list = generate_unique_bingo_cards(player_count, master_dict, maximize_unique_prompts=True)
-        bingo_cards_dict = {i+1: cards_list[i] for i in range(player_count)}
-        if game_seed is not None:
-            game_seed += 1
-    else:
-        bingo_cards_dict = {}
-        for i in range(player_count):
-            bingo_cards_dict[i+1] = generate_bingo_card(master_dict)
-    
-    # Write to JSON
-    with open(filename, 'w') as out_file:
-        json.dump(bingo_cards_dict, indent=4, fp=out_file)
-    
-    print(f"Successfully saved {args.player_count} bingo cards to {filename}.")
+    if args.derive and game_seed is None:
+        game_seed = random.randrange(2**32)
+        print(f"No seed given, using --seed {game_seed} (you need it to rebuild cards).")
+    bingo_cards_dict = dict(iter_bingo_cards(player_count, master_dict, args.maximize_unique,
+                                             seed=game_seed, derive=args.derive, samplers=samplers,
+                                             history=history, players=players))
+
+    # Write to JSON (compressed if the filename ends in .gz, .bz2 or .xz)
+    bingo_card_io.dump_json(bingo_cards_dict, filename)
+
+    print(f"Successfully saved {player_count} bingo cards to {filename}.")
+    if history is not None:
+        history.save(args.history)
+        print(f"Recorded this event's prompts for {len(set(players[:player_count]))} "
+              f"player(s) in {args.history}.")
     if args.maximize_unique:
         print("Cards generated with maximum unique prompts across all players.")
     
@@ -252,4 +611,7 @@ if __name__ == "__main__":
             if square and square.get('content'):
                 used_prompts.add(square['content'])
     
-    print(f"Total unique prompts used: {len(used_prompts)} out of {total_prompts} available.")
\ No newline at end of file
+    print(f"Total unique prompts used: {len(used_prompts)} out of {total_prompts} available.")
+
+if __name__ == "__main__":
+    main()
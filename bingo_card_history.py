@@ -0,0 +1,108 @@
+"""
+Bingo Card History
+
+Remembers which prompts each player (or card series) has been given at past
+events, so regulars don't keep getting the same squares.
+
+Each player gets a small Bloom filter over prompt text: a fixed-size bitset where
+every prompt sets a few bits. Checking a prompt is O(1) and a player costs the same
+few hundred bytes however many events they attend. The catch is the occasional false
+positive (a prompt reported as seen when it wasn't), which only means that prompt is
+skipped for that player; with the defaults that stays below 1% even for someone who
+has seen a 90-prompt bank in full.
+
+FILE FORMAT:
+------------
+    {
+        "bits": 1024,
+        "hashes": 5,
+        "players": {"Adrianna": "<base64 bitset>", ...}
+    }
+
+USAGE:
+------
+See --history, --players and --series in bingo_card_generator.py:
+    python bingo_card_generator.py --players guests.txt --history history.json
+"""
+
+import base64
+import hashlib
+
+import bingo_card_io
+
+DEFAULT_BITS = 1024
+DEFAULT_HASHES = 5
+
+
+class PromptBloomFilter:
+    def __init__(self, bits=DEFAULT_BITS, hashes=DEFAULT_HASHES, value=0):
+        self.bits = bits
+        self.hashes = hashes
+        self.value = value  # the bitset, as a Python int
+
+    def _positions(self, prompt):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, prompt):
+        for position in self._positions(prompt):
+            self.value |= 1 << position
+
+    def __contains__(self, prompt):
+        value = self.value
+        return all(value >> position & 1 for position in self._positions(prompt))
+
+    def copy(self):
+        return PromptBloomFilter(self.bits, self.hashes, self.value)
+
+    def to_text(self):
+        return base64.b64encode(self.value.to_bytes(self.bits // 8, 'little')).decode('ascii')
+
+    @classmethod
+    def from_text(cls, text, bits, hashes):
+        return cls(bits, hashes, int.from_bytes(base64.b64decode(text), 'little'))
+
+
+class PromptHistory:
+    """Per-player Bloom filters of the prompts they have already received"""
+
+    def __init__(self, bits=DEFAULT_BITS, hashes=DEFAULT_HASHES, players=None):
+        if bits % 8:
+            raise ValueError("Bloom filter size must be a multiple of 8 bits")
+        self.bits = bits
+        self.hashes = hashes
+        self.players = players if players is not None else {}
+
+    @classmethod
+    def load(cls, path):
+        """Read a history file. A missing file is an empty history."""
+        try:
+            data = bingo_card_io.load_json(path)
+        except FileNotFoundError:
+            return cls()
+        bits, hashes = data['bits'], data['hashes']
+        players = {name: PromptBloomFilter.from_text(text, bits, hashes)
+                   for name, text in data['players'].items()}
+        return cls(bits, hashes, players)
+
+    def save(self, path):
+        data = {
+            'bits': self.bits,
+            'hashes': self.hashes,
+            'players': {name: bloom.to_text() for name, bloom in sorted(self.players.items())},
+        }
+        # Atomic, so a crash never loses earlier events
+        bingo_card_io.dump_json(data, path, indent=1, atomic=True)
+
+    def seen(self, player):
+        """Snapshot of what player had received before now (empty for a new player)"""
+        bloom = self.players.get(player)
+        return bloom.copy() if bloom else PromptBloomFilter(self.bits, self.hashes)
+
+    def record(self, player, prompts):
+        bloom = self.players.setdefault(player, PromptBloomFilter(self.bits, self.hashes))
+        for prompt in prompts:
+            bloom.add(prompt)
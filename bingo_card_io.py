@@ -0,0 +1,189 @@
+"""
+Bingo Card I/O
+
+Reading and writing the card and completion JSON files, compressed or not. The
+compression is picked from the file extension:
+
+    bingo_cards.json        plain text
+    bingo_cards.json.gz     gzip
+    bingo_cards.json.bz2    bzip2
+    bingo_cards.json.xz     xz (.lzma works too)
+
+Big decks compress very well (every card repeats the same keys and prompts): a
+.gz deck is typically well under a tenth of the size.
+
+Files are read a chunk at a time: the decompressor only ever inflates the next
+chunk, and each card is decoded as soon as its text has arrived, so neither the
+compressed nor the decompressed file is held in memory as a whole.
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+import pathlib
+import re
+import secrets
+
+COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open,
+}
+
+# Raised on top of OSError/JSONDecodeError when a compressed file is corrupt or cut short
+DECOMPRESSION_ERRORS = (EOFError, lzma.LZMAError)
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# What may be left of a number cut off at the end of a chunk ("1.", "-1.5e", ...)
+_NUMBER_TAIL = re.compile(r'[0-9.eE+\-]*')
+
+
+def compression_suffix(path):
+    """'.gz', '.bz2', '.xz' or '.lzma' if path is compressed, else ''"""
+    suffix = pathlib.Path(path).suffix.lower()
+    return suffix if suffix in COMPRESSED_OPENERS else ''
+
+
+def open_data_file(path, mode='r'):
+    """open() a text file, (de)compressing on the fly according to its extension"""
+    opener = COMPRESSED_OPENERS.get(compression_suffix(path), open)
+    return opener(path, mode.replace('t', '') + 't', encoding='utf-8')
+
+
+class _JSONStream:
+    """Tokenizer over a text file that only keeps the not yet decoded text in memory"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        # Where buf[0] is in the file, for error messages
+        self.offset = 0
+        self.lineno = 1
+        self.column = 0
+
+    def _fill(self):
+        newlines = self.buf.count('\n', 0, self.pos)
+        if newlines:
+            self.lineno += newlines
+            self.column = self.pos - self.buf.rindex('\n', 0, self.pos) - 1
+        else:
+            self.column += self.pos
+        self.offset += self.pos
+
+        chunk = self.f.read(self.chunk_size)
+        self.eof = not chunk
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def error(self, msg, pos=None):
+        """JSONDecodeError for buf[pos], positioned from the start of the file like json.load's"""
+        pos = self.pos if pos is None else pos
+        newlines = self.buf.count('\n', 0, pos)
+        lineno = self.lineno + newlines
+        colno = pos - self.buf.rindex('\n', 0, pos) if newlines else self.column + pos + 1
+        error = json.JSONDecodeError(msg, self.buf, pos)
+        error.pos = self.offset + pos
+        error.lineno, error.colno = lineno, colno
+        error.args = (f"{msg}: line {lineno} column {colno} (char {error.pos})",)
+        return error
+
+    def _skip_whitespace(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or self.eof:
+                return
+            self._fill()
+
+    def expect(self, chars, msg):
+        """Consume and return the next non-whitespace character, which must be one of chars"""
+        self._skip_whitespace()
+        if self.pos >= len(self.buf) or self.buf[self.pos] not in chars:
+            raise self.error(msg)
+        self.pos += 1
+        return self.buf[self.pos - 1]
+
+    def peek(self):
+        self._skip_whitespace()
+        return self.buf[self.pos:self.pos + 1]
+
+    def value(self):
+        """Decode the next JSON value, reading more of the file until it is complete"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self.error(e.msg, e.pos) from None
+                self._fill()
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if not self.eof and _NUMBER_TAIL.fullmatch(self.buf, end):
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_items(f, chunk_size=CHUNK_SIZE):
+    """Yield the (key, value) pairs of the top-level JSON object in text file f, as they are read"""
+    stream = _JSONStream(f, chunk_size)
+    stream.expect('{', "Expecting '{'")
+    if stream.peek() == '}':
+        stream.expect('}', "Expecting '}'")
+    else:
+        while True:
+            if stream.peek() != '"':
+                raise stream.error("Expecting property name enclosed in double quotes")
+            key = stream.value()
+            stream.expect(':', "Expecting ':' delimiter")
+            yield key, stream.value()
+            if stream.expect(',}', "Expecting ',' delimiter") == '}':
+                break
+    if stream.peek():
+        raise stream.error("Extra data")
+
+
+def square_category(square):
+    """Category of a card square; older card files call it the spice level. None if it has neither."""
+    return square.get('category') or square.get('spice_level')
+
+
+def load_json(path):
+    """json.load for a card or completions file (a JSON object), compressed or not"""
+    with open_data_file(path) as f:
+        return dict(iter_json_items(f))
+
+
+def dump_json(data, path, indent=4, atomic=False):
+    """json.dump to path, compressing according to its extension.
+
+    With atomic=True the data is written beside path and swapped in once complete, so
+    readers (or a crash) never see a half written file.
+    """
+    if not atomic:
+        with open_data_file(path, 'w') as f:
+            json.dump(data, f, indent=indent)
+        return
+
+    path = pathlib.Path(path)
+    # Keep the real name at the end so the temporary file gets the same compression
+    temp_path = path.with_name(f'.tmp-{secrets.token_hex(4)}-{path.name}')
+    # Created like open() would, with the usual umask permissions
+    os.close(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        with open_data_file(temp_path, 'w') as f:
+            json.dump(data, f, indent=indent)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
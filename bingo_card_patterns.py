@@ -0,0 +1,170 @@
+"""
+Bingo Card Patterns
+
+Bitboard scoring for a 3x3 card. A card's completed and doubled squares are each
+held in a 9-bit mask, with bit i standing for POSITIONS[i] (top_left is bit 0,
+bottom_right is bit 8). Win patterns (rows, columns, diagonals, four corners,
+blackout and any custom ones) are masks too, so checking a pattern is a single
+`completed & mask == mask`.
+
+All 512 completion states are scored against every pattern up front, so scoring a
+card is one table lookup however many patterns are defined.
+
+PATTERN FILE:
+-------------
+Bonus points can be changed with a JSON file (see load_patterns):
+    {
+        "line": 3,
+        "four_corners": 3,
+        "blackout": 10,
+        "custom": [
+            {"name": "Plus sign", "squares": ["top_middle", "middle_left", "centre", "middle_right", "bottom_middle"], "bonus": 4}
+        ]
+    }
+Setting a bonus to 0 turns that pattern off.
+"""
+
+import json
+
+from bingo_card_generator import POSITIONS
+
+BIT = {position: 1 << i for i, position in enumerate(POSITIONS)}
+ALL_SQUARES = (1 << len(POSITIONS)) - 1
+
+DEFAULT_BONUSES = {
+    "line": 3,
+    "four_corners": 3,
+    "blackout": 10,
+}
+
+# Cards with at least this many doubled squares have their whole score doubled
+NEW_FRIEND_THRESHOLD = 5
+
+
+def mask_of(positions):
+    """9-bit mask with the bits for the given position names set"""
+    mask = 0
+    for position in positions:
+        mask |= BIT[position]
+    return mask
+
+
+def positions_of(mask):
+    """Position names whose bits are set in mask, in card order"""
+    return [position for position in POSITIONS if mask & BIT[position]]
+
+
+def _line_patterns():
+    rows = [POSITIONS[i:i+3] for i in range(0, 9, 3)]
+    columns = [POSITIONS[i::3] for i in range(3)]
+    diagonals = [POSITIONS[0::4], POSITIONS[2:7:2]]
+    names = ["Top row", "Middle row", "Bottom row",
+             "Left column", "Middle column", "Right column",
+             "Diagonal", "Anti-diagonal"]
+    return [(name, mask_of(squares)) for name, squares in zip(names, rows + columns + diagonals)]
+
+
+LINE_PATTERNS = _line_patterns()
+FOUR_CORNERS = mask_of(["top_left", "top_right", "bottom_left", "bottom_right"])
+
+
+def build_patterns(bonuses=None, custom=()):
+    """List of (name, mask, bonus) for every pattern worth any points"""
+    bonuses = {**DEFAULT_BONUSES, **(bonuses or {})}
+    patterns = [(name, mask, bonuses["line"]) for name, mask in LINE_PATTERNS]
+    patterns.append(("Four corners", FOUR_CORNERS, bonuses["four_corners"]))
+    patterns.append(("Blackout", ALL_SQUARES, bonuses["blackout"]))
+    for rule in custom:
+        patterns.append((rule["name"], mask_of(rule["squares"]), rule["bonus"]))
+    return [pattern for pattern in patterns if pattern[2]]
+
+
+def _is_bonus(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def load_patterns(path):
+    """Read bonus points and custom patterns from a JSON file. Raises ValueError if it is malformed."""
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must hold a JSON object of bonus points")
+    custom = config.pop("custom", [])
+    unknown = set(config) - set(DEFAULT_BONUSES)
+    if unknown:
+        raise ValueError(f"Unknown bonus type(s) in {path}: {', '.join(sorted(unknown))}")
+    for kind, bonus in config.items():
+        if not _is_bonus(bonus):
+            raise ValueError(f"Bonus for '{kind}' in {path} must be a whole number, not {bonus!r}")
+    if not isinstance(custom, list):
+        raise ValueError(f"'custom' in {path} must be a list of patterns")
+    for rule in custom:
+        if not isinstance(rule, dict) or not {"name", "squares", "bonus"} <= set(rule):
+            raise ValueError(f"Every custom pattern in {path} needs a name, squares and bonus: {rule!r}")
+        if not _is_bonus(rule["bonus"]):
+            raise ValueError(f"Bonus for pattern '{rule['name']}' in {path} must be a whole number, "
+                             f"not {rule['bonus']!r}")
+        if not isinstance(rule["squares"], list) or not all(isinstance(p, str) for p in rule["squares"]):
+            raise ValueError(f"Squares of pattern '{rule['name']}' in {path} must be a list of position names")
+        bad = set(rule["squares"]) - set(BIT)
+        if bad:
+            raise ValueError(f"Pattern '{rule['name']}' in {path} uses unknown position(s): {', '.join(sorted(bad))}")
+    return build_patterns(config, custom)
+
+
+class BonusTable:
+    """Pattern bonus for each of the 512 completion states, computed once"""
+
+    def __init__(self, patterns=None):
+        if patterns is None:
+            patterns = build_patterns()
+        self.patterns = patterns
+        self.bonus = [0] * (ALL_SQUARES + 1)
+        self.matches = [()] * (ALL_SQUARES + 1)
+        for state in range(ALL_SQUARES + 1):
+            matched = tuple((name, bonus) for name, mask, bonus in patterns if state & mask == mask)
+            self.matches[state] = matched
+            self.bonus[state] = sum(bonus for _, bonus in matched)
+
+    def lookup(self, completed):
+        """(total bonus, ((pattern name, bonus), ...)) for a completion mask"""
+        return self.bonus[completed], self.matches[completed]
+
+
+def score_card(levels, completed, doubled, level_points, table):
+    """Score one card.
+
+    levels: spice level of each square, in POSITIONS order
+    completed, doubled: 9-bit masks (doubled squares only count if completed)
+    Returns a dict with the square points, pattern bonuses and final total.
+    """
+    doubled &= completed
+    squares = []
+    square_total = 0
+    for i, level in enumerate(levels):
+        bit = 1 << i
+        if not completed & bit or not level:
+            continue
+        points = level_points.get(level, 0)
+        if doubled & bit:
+            points *= 2
+        square_total += points
+        squares.append((POSITIONS[i], level, points))
+
+    bonus, matched = table.lookup(completed)
+    new_friends = doubled.bit_count()
+    new_friend_bonus = new_friends >= NEW_FRIEND_THRESHOLD
+
+    total = square_total + bonus
+    if new_friend_bonus:
+        total *= 2
+
+    return {
+        "squares": squares,
+        "square_total": square_total,
+        "patterns": matched,
+        "bonus": bonus,
+        "new_friends": new_friends,
+        "new_friend_bonus": new_friend_bonus,
+        "total": total,
+    }
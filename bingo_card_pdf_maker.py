@@ -7,6 +7,12 @@ USAGE:
     python bingo_card_pdf_maker.py data.json --title "Birthday Bingo" --description "Find people who match these descriptions!"
     python bingo_card_pdf_maker.py data.json -o output.pdf -t "Event Bingo" -d "Get signatures for each square"
     python bingo_card_pdf_maker.py data.json  # Uses default title and description
+    python bingo_card_pdf_maker.py --derive-seed 420 --count 50          # No JSON needed, see --derive in the generator
+    python bingo_card_pdf_maker.py --derive-seed 420 --cards 17 4213     # Reprint individual cards
+
+PIPELINE (generate and render in one go, see pipeline_main):
+    python bingo.py pipeline -n 5000 --maximize-unique -o cards.pdf
+    python bingo.py pipeline -n 5000 -s 420 --json bingo_cards.json    # also keep the card data
 
 FEATURES:
 - Uses Courier font for all text.
@@ -16,28 +22,37 @@ FEATURES:
 - Wider cell width (3.7 * inch / 3).
 - More spacing between the two cards.
 - Customizable title and description via command line arguments.
+- Cards made with the generator's --derive mode can be rebuilt from the seed and question bank alone.
+- Card files may be compressed (data.json.gz, .bz2 or .xz), see bingo_card_io.py.
 """
 
 import json
 import sys
 import argparse
+import pathlib
 from reportlab.lib.pagesizes import letter, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, PageBreak, Flowable, Paragraph
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, PageBreak, Flowable, Paragraph, Frame
+from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_CENTER
 
+import bingo_card_generator
+import bingo_card_io
+
 
 def load_bingo_data(json_path):
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return bingo_card_io.load_json(json_path)
     except FileNotFoundError:
         print(f"Error: File '{json_path}' not found.")
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON format in '{json_path}': {e}")
         sys.exit(1)
+    except (OSError, *bingo_card_io.DECOMPRESSION_ERRORS) as e:
+        print(f"Error: Could not decompress '{json_path}': {e}")
+        sys.exit(1)
 
 
 def validate_bingo_data(data):
@@ -164,24 +179,26 @@ def create_side_by_side_cards(card1_data, card2_data=None, title="Bingo Card", d
     return table
 
 
-def generate_bingo_pdf(json_path, output_path=None, title=None, description=None):
-    bingo_data = load_bingo_data(json_path)
-    validate_bingo_data(bingo_data)
+DEFAULT_TITLE = "Meet the Lovely People @ Lulu's B-day"
+DEFAULT_DESCRIPTION = ('Find party-goers who identify with the following descriptions, '
+                       'and ask them to sign to "stamp" the square. No one can sign '
+                       'a single card twice! See Lulu after all squares are completed for maybe a prize...')
 
-    # Default values if not provided
-    if title is None:
-        title = "Meet the Lovely People @ Lulu's B-day"
-    
-    if description is None:
-        description = ('Find party-goers who identify with the following descriptions, '
-                      'and ask them to sign to "stamp" the square. No one can sign '
-                      'a single card twice! See Lulu after all squares are completed for maybe a prize...')
 
-    card_grids = [convert_card_to_grid(bingo_data[num]) for num in sorted(bingo_data.keys(), key=lambda x: int(x))]
+def build_story(card_grids, title, description):
+    """Lay out card grids two per page"""
+    story = []
+    for i in range(0, len(card_grids), 2):
+        card1_data = card_grids[i]
+        card2_data = card_grids[i+1] if i+1 < len(card_grids) else None
+        story.append(create_side_by_side_cards(card1_data, card2_data, title, description))
+        if i + 2 < len(card_grids):
+            story.append(PageBreak())
+    return story
 
-    if output_path is None:
-        output_path = json_path.replace('.json', '_bingo_cards.pdf')
 
+def build_pdf(card_grids, output_path, title=DEFAULT_TITLE, description=DEFAULT_DESCRIPTION):
+    """Write card grids to a PDF at output_path, two cards per page"""
     doc = SimpleDocTemplate(
         output_path,
         pagesize=landscape(letter),
@@ -190,17 +207,67 @@ def generate_bingo_pdf(json_path, output_path=None, title=None, description=None
         topMargin=0.5*inch,
         bottomMargin=0.5*inch
     )
+    doc.build(build_story(card_grids, title, description))
+
+
+def stream_bingo_pdf(cards, output_path, title=DEFAULT_TITLE, description=DEFAULT_DESCRIPTION):
+    """Render an iterable of card dicts to PDF as they arrive, two per page.
+
+    Pages are drawn straight onto the canvas instead of building a story for the
+    whole deck, so cards can come from a generator. Layout matches build_pdf.
+    Returns the number of cards rendered.
+    """
+    page_width, page_height = landscape(letter)
+    margin = 0.5*inch
+    canv = canvas.Canvas(output_path, pagesize=(page_width, page_height))
+
+    def draw_page(card1_data, card2_data):
+        frame = Frame(margin, margin, page_width - 2*margin, page_height - 2*margin)
+        frame.add(create_side_by_side_cards(card1_data, card2_data, title, description), canv)
+        canv.showPage()
+
+    count = 0
+    pending = None
+    for card in cards:
+        count += 1
+        validate_bingo_data({count: card})
+        grid = convert_card_to_grid(card)
+        if pending is None:
+            pending = grid
+        else:
+            draw_page(pending, grid)
+            pending = None
+    if pending is not None:
+        draw_page(pending, None)
+
+    canv.save()
+    return count
 
-    story = []
-    for i in range(0, len(card_grids), 2):
-        card1_data = card_grids[i]
-        card2_data = card_grids[i+1] if i+1 < len(card_grids) else None
-        story.append(create_side_by_side_cards(card1_data, card2_data, title, description))
-        if i + 2 < len(card_grids):
-            story.append(PageBreak())
+
+def generate_bingo_pdf(json_path, output_path=None, title=None, description=None):
+    bingo_data = load_bingo_data(json_path)
+
+    if output_path is None:
+        suffix = bingo_card_io.compression_suffix(json_path)
+        output_path = json_path[:len(json_path) - len(suffix)].replace('.json', '_bingo_cards.pdf')
+
+    render_bingo_data(bingo_data, output_path, title, description)
+
+
+def render_bingo_data(bingo_data, output_path, title=None, description=None):
+    validate_bingo_data(bingo_data)
+
+    # Default values if not provided
+    if title is None:
+        title = DEFAULT_TITLE
+    
+    if description is None:
+        description = DEFAULT_DESCRIPTION
+
+    card_grids = [convert_card_to_grid(bingo_data[num]) for num in sorted(bingo_data.keys(), key=lambda x: int(x))]
 
     try:
-        doc.build(story)
+        build_pdf(card_grids, output_path, title, description)
         print(f"Successfully generated PDF: {output_path}")
         if title:
             print(f"Title: {title}")
@@ -211,7 +278,7 @@ def generate_bingo_pdf(json_path, output_path=None, title=None, description=None
         sys.exit(1)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Generate PDF bingo cards from JSON data with customizable title and description",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -224,14 +291,81 @@ Examples:
         """
     )
     
-    parser.add_argument('json_file', help='Path to JSON file containing bingo card data')
+    parser.add_argument('json_file', nargs='?', help='Path to JSON file containing bingo card data')
     parser.add_argument('-o', '--output', help='Output PDF filename (optional)')
     parser.add_argument('-t', '--title', help='Custom title for the bingo cards (optional)')
     parser.add_argument('-d', '--description', help='Custom description/instructions for the bingo cards (optional)')
     
-    args = parser.parse_args()
-    
-    generate_bingo_pdf(args.json_file, args.output, args.title, args.description)
+
+    derive_group = parser.add_argument_group('derived cards', 'Rebuild cards made with the generator\'s --derive mode instead of reading a JSON')
+    derive_group.add_argument('--derive-seed', type=int, help='Seed the cards were generated with')
+    derive_group.add_argument('--count', type=int, help='Render cards 1 to COUNT')
+    derive_group.add_argument('--cards', type=int, nargs='+', metavar='ID', help='Render only these card IDs')
+    derive_group.add_argument('--questions', nargs=3, type=pathlib.Path, metavar=('file1', 'file2', 'file3'),
+                              help='Question bank files the cards were generated from')
+    derive_group.add_argument('--maximize-unique', action='store_true',
+                              help='The cards were generated with --maximize-unique')
+
+    args = parser.parse_args(argv)
+
+    if args.derive_seed is None:
+        if args.json_file is None:
+            parser.error('a JSON file is required unless --derive-seed is given')
+        generate_bingo_pdf(args.json_file, args.output, args.title, args.description)
+        return
+
+    if args.cards is None and args.count is None:
+        parser.error('--derive-seed needs --count or --cards')
+
+    question_files = args.questions or bingo_card_generator.DEFAULT_QUESTION_FILES
+    master_dict = bingo_card_generator.generate_master_dict(question_files)
+    samplers = bingo_card_generator.load_prompt_weights(question_files, master_dict)
+    card_ids = args.cards or range(1, args.count + 1)
+    bingo_data = bingo_card_generator.derive_bingo_cards(master_dict, args.derive_seed, card_ids,
+                                                         maximize_unique_prompts=args.maximize_unique,
+                                                         samplers=samplers)
+    output_path = args.output or f"bingo_cards_seed{args.derive_seed}_bingo_cards.pdf"
+    render_bingo_data(bingo_data, output_path, args.title, args.description)
+
+
+def pipeline_main(argv=None):
+    """Generate cards and render them to PDF in one pass, without an intermediate JSON"""
+    parser = argparse.ArgumentParser(
+        description="Generate bingo cards and stream them straight into a PDF"
+    )
+    parser.add_argument('-n', '--player-count', type=int, required=True, help='Number of bingo cards to generate')
+    parser.add_argument('-s', '--seed', type=int, default=None, help='Seed for generating the cards')
+    parser.add_argument('--questions', nargs=3, type=pathlib.Path, metavar=('file1', 'file2', 'file3'),
+                        default=bingo_card_generator.DEFAULT_QUESTION_FILES)
+    parser.add_argument('--maximize-unique', action='store_true',
+                        help='Ensure maximum unique prompts across all cards (no duplicates until necessary)')
+    parser.add_argument('--derive', action='store_true',
+                        help='Derive each card from (seed, card ID, question bank), see the generator')
+    parser.add_argument('-o', '--output', default='bingo_cards.pdf', help='Output PDF filename')
+    parser.add_argument('--json', type=pathlib.Path,
+                        help='Also write the card data to this JSON file as cards are generated')
+    parser.add_argument('-t', '--title', default=DEFAULT_TITLE, help='Custom title for the bingo cards (optional)')
+    parser.add_argument('-d', '--description', default=DEFAULT_DESCRIPTION,
+                        help='Custom description/instructions for the bingo cards (optional)')
+    args = parser.parse_args(argv)
+
+    seed = args.seed
+    if args.derive and seed is None:
+        seed = bingo_card_generator.random.randrange(2**32)
+        print(f"No seed given, using --seed {seed} (you need it to rebuild cards).")
+
+    master_dict = bingo_card_generator.generate_master_dict(args.questions)
+    samplers = bingo_card_generator.load_prompt_weights(args.questions, master_dict)
+    cards = bingo_card_generator.iter_bingo_cards(args.player_count, master_dict, args.maximize_unique,
+                                                  seed=seed, derive=args.derive, samplers=samplers)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        cards = bingo_card_generator.write_cards_json(cards, args.json)
+
+    count = stream_bingo_pdf((card for _, card in cards), args.output, args.title, args.description)
+    print(f"Successfully generated PDF with {count} cards: {args.output}")
+    if args.json:
+        print(f"Card data saved to {args.json}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,35 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
-import json
 import os
+import argparse
+import pathlib
+import queue
+import threading
+
+import bingo_card_generator
+import bingo_card_io
+import bingo_card_patterns
+
+# Rapid-entry mode: keycodes of the top-row 1..9 keys, which don't depend on the keyboard
+# layout (Shift+2 types '"' on a UK keyboard). Other windowing systems (aqua on macOS)
+# fall back to the typed character: a digit, or what Shift+1..9 types on a US keyboard.
+RAPID_DIGIT_KEYCODES = {
+    "x11": {10 + i: i for i in range(9)},
+    "win32": {ord("1") + i: i for i in range(9)},
+}
+RAPID_SHIFTED_DIGIT_KEYSYMS = {keysym: i for i, keysym in enumerate(
+    ("exclam", "at", "numbersign", "dollar", "percent", "asciicircum", "ampersand", "asterisk", "parenleft"))}
+
+RAPID_INSTRUCTIONS = ("Type a card ID, then Enter.  1-9: completed  Shift+1-9: new friend bonus  "
+                      "Enter: score, save & next card  Esc: type another ID")
 
 class BingoScorer(tk.Tk):
-    def __init__(self):
+    def __init__(self, cards_file="bingo_cards.json", derive=None, patterns=None, rapid=False):
+        """derive: optional (master_dict, seed, maximize_unique, samplers) for cards made with the
+        generator's --derive mode. Cards missing from cards_file are then rebuilt on demand.
+        patterns: (name, mask, bonus) win patterns, see bingo_card_patterns. Defaults to
+        rows, columns, diagonals, four corners and blackout.
+        rapid: keyboard-driven scoring with no modal dialogs, see enable_rapid_entry."""
         super().__init__()
         
         self.title("Adrianna's Bingo Scorer!")
@@ -33,10 +58,17 @@ class BingoScorer(tk.Tk):
         
         # Reverse mapping for loading
         self.reverse_position_mapping = {v: k for k, v in self.position_mapping.items()}
+
+        # Line/pattern bonuses for all 512 completion states
+        self.bonus_table = bingo_card_patterns.BonusTable(patterns)
         
         # Store loaded cards data
+        self.cards_file = cards_file
+        self.derive = derive
         self.cards_data = {}
         self.current_card_id = None
+        self.rapid = rapid
+        self.save_results = queue.Queue()
         
         # Create frames
         self.create_header_frame()
@@ -50,6 +82,9 @@ class BingoScorer(tk.Tk):
         
         # Load cards data
         self.load_cards_data()
+
+        if self.rapid:
+            self.enable_rapid_entry()
     # def create_window_grid()
         
     def create_header_frame(self):
@@ -59,7 +94,7 @@ class BingoScorer(tk.Tk):
         title_label = tk.Label(header_frame, text="Custom Bingo Scorer", font=("Arial", 16, "bold"))
         title_label.pack()
         
-        instructions = "Load a card by ID and mark completed/doubled squares"
+        instructions = RAPID_INSTRUCTIONS if self.rapid else "Load a card by ID and mark completed/doubled squares"
         instructions_label = tk.Label(header_frame, text=instructions, font=("Arial", 10))
         instructions_label.pack()
         
@@ -70,8 +105,16 @@ class BingoScorer(tk.Tk):
         tk.Label(card_frame, text="Current Card:").pack(side="left")
         self.card_id_label = tk.Label(card_frame, text="None", width=10)
         self.card_id_label.pack(side="left", padx=5)
-        
-        load_card_btn = tk.Button(card_frame, text="Load Card by ID", command=self.prompt_card_id)
+
+        if self.rapid:
+            tk.Label(card_frame, text="Card ID:").pack(side="left")
+            self.card_id_var = tk.StringVar()
+            self.card_id_entry = tk.Entry(card_frame, textvariable=self.card_id_var, width=8)
+            self.card_id_entry.pack(side="left", padx=5)
+        
+        # Rapid mode has no pop-ups: the button just jumps to the card ID box
+        load_card_btn = tk.Button(card_frame, text="Load Card by ID",
+                                  command=self.focus_card_id_entry if self.rapid else self.prompt_card_id)
         load_card_btn.pack(side="left", padx=5)
         
         refresh_data_btn = tk.Button(card_frame, text="Refresh Cards Data", command=self.load_cards_data)
@@ -83,11 +126,13 @@ class BingoScorer(tk.Tk):
         
         tk.Label(points_frame, text="Points per spice level:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w")
         
+        self.level_entries = {}
         for i, level in enumerate(["innocent", "mild", "spicy"]):
             tk.Label(points_frame, text=f"{level.capitalize()}:").grid(row=0, column=i*2+1, padx=(10, 0))
             level_entry = tk.Entry(points_frame, width=2)
             level_entry.insert(0, str(self.level_points[level]))
             level_entry.grid(row=0, column=i*2+2, padx=(0, 10))
+            self.level_entries[level] = level_entry
             level_entry.bind("<KeyRelease>", lambda event, lvl=level, entry=level_entry: self.update_level_points(lvl, entry))
 
     def create_grid_frame(self):
@@ -112,6 +157,9 @@ class BingoScorer(tk.Tk):
         load_btn = tk.Button(controls_frame, text="Load Completions", command=self.load_completions)
         load_btn.pack(side="left", padx=5)
 
+        self.status_label = tk.Label(controls_frame, text="", anchor="w")
+        self.status_label.pack(side="left", padx=5, fill="x", expand=True)
+
     def create_results_frame(self):
         self.results_frame = tk.Frame(self)
         
@@ -140,8 +188,11 @@ class BingoScorer(tk.Tk):
                     square_frame = tk.Frame(bingo_frame, relief="raised", borderwidth=2)
                     square_frame.grid(row=row, column=col, padx=5, pady=0, sticky="nsew")
        
-                    # Position label
-                    position_label = tk.Label(square_frame, text=position.replace("_", " ").title(), font=("Arial", 12, "bold"))
+                    # Position label, with its rapid-entry key
+                    position_text = position.replace("_", " ").title()
+                    if self.rapid:
+                        position_text = f"[{row * 3 + col + 1}] {position_text}"
+                    position_label = tk.Label(square_frame, text=position_text, font=("Arial", 12, "bold"))
                     position_label.pack(anchor="nw", padx=5, pady=(5, 0))
                     
                     # Spice level display with colorful label
@@ -213,6 +264,14 @@ class BingoScorer(tk.Tk):
         self.score_label.config(text="Score: 0")
         self.details_text.delete(1.0, tk.END)
 
+    def notify(self, kind, title, message):
+        """Tell the user something: a dialog normally, the status bar in rapid-entry mode"""
+        if self.rapid:
+            self.status_label.config(text=message, fg="red" if kind == "error" else "black")
+            return
+        show = {"info": messagebox.showinfo, "warning": messagebox.showwarning, "error": messagebox.showerror}[kind]
+        show(title, message)
+
     def get_color_for_spice_level(self, spice_level):
         if spice_level == "innocent":
             return "#E8F5E9"  # Light green
@@ -222,43 +281,49 @@ class BingoScorer(tk.Tk):
             return "#FFEBEE"  # Light red
         return "white"
 
+    def card_masks(self):
+        """Completed and doubled squares of the current card as 9-bit masks"""
+        completed = doubled = 0
+        for position, bit in bingo_card_patterns.BIT.items():
+            square = self.squares[position]
+            if square["completed_var"].get():
+                completed |= bit
+            if square["doubled_var"].get():
+                doubled |= bit
+        return completed, doubled
+
     def calculate_score(self):
         if not self.current_card_id:
-            messagebox.showinfo("Info", "Please load a card first.")
+            self.notify("info", "Info", "Please load a card first.")
             return
-            
-        total_score = 0
+
+        completed, doubled = self.card_masks()
+        levels = [self.squares[position]["spice_level"] for position in bingo_card_generator.POSITIONS]
+        result = bingo_card_patterns.score_card(levels, completed, doubled, self.level_points, self.bonus_table)
+
         details = []
-        doubled_count = 0
-        new_friend_bonus = False
-        for position, square in self.squares.items():
-            spice_level = square["spice_level"]
-            completed = square["completed_var"].get()
-            doubled = square["doubled_var"].get()
-            
-            if completed and spice_level:
-                square_points = self.level_points.get(spice_level, 0)
-                if doubled:
-                    square_points *= 2
-                    doubled_count += 1 
-                    if doubled_count >= 5:
-                        new_friend_bonus = True
-                
-                total_score += square_points
-                position_text = position.replace("_", " ").title()
-                details.append(f"{position_text}: {spice_level.capitalize()} ({self.level_points.get(spice_level, 0)} pts)" + 
-                              (f" x2 = {square_points}" if doubled else f" = {square_points}"))
-                details.append(f"New friends made: {doubled_count}")
-                details.append(f"Running score so far: {total_score}")
-        
+        running_total = 0
+        new_friends = 0
+        for position, spice_level, square_points in result["squares"]:
+            doubled_square = bool(doubled & bingo_card_patterns.BIT[position])
+            new_friends += doubled_square
+            running_total += square_points
+            position_text = position.replace("_", " ").title()
+            details.append(f"{position_text}: {spice_level.capitalize()} ({self.level_points.get(spice_level, 0)} pts)" +
+                          (f" x2 = {square_points}" if doubled_square else f" = {square_points}"))
+            details.append(f"New friends made: {new_friends}")
+            details.append(f"Running score so far: {running_total}")
+        for name, bonus in result["patterns"]:
+            details.append(f"{name} bonus: +{bonus}")
+
+        total_score = result["total"]
         self.details_text.delete(1.0, tk.END)
         if details:
             self.details_text.insert(tk.END, f"Scoring Details for Card {self.current_card_id}:\n\n")
             for detail in details:
                 self.details_text.insert(tk.END, detail + "\n")
-            if new_friend_bonus:
-                    total_score *= 2
-                    self.details_text.insert(tk.END, 'Entire scorecard multiplied by 2 (New Friend Bonus). Wow!')
+            if result["new_friend_bonus"]:
+                self.details_text.insert(tk.END, 'Entire scorecard multiplied by 2 (New Friend Bonus). Wow!')
             self.details_text.insert(tk.END, f"\nTotal Score: {total_score}")
         else:
             self.details_text.insert(tk.END, "No squares completed yet.")
@@ -266,22 +331,24 @@ class BingoScorer(tk.Tk):
         self.score_label.config(text=f"Score: {total_score}")
 
     def load_cards_data(self):
-        cards_file = "bingo_cards.json"
+        cards_file = self.cards_file
         
         if not os.path.exists(cards_file):
-            messagebox.showwarning("Warning", f"Cards file '{cards_file}' not found. Please create this file with your bingo card data.")
+            if self.derive:
+                # Cards are rebuilt from the seed, the JSON is optional
+                return
+            self.notify("warning", "Warning", f"Cards file '{cards_file}' not found. Please create this file with your bingo card data.")
             return
         
         try:
-            with open(cards_file, "r") as f:
-                self.cards_data = json.load(f)
-            messagebox.showinfo("Success", f"Loaded {len(self.cards_data)} cards from {cards_file}")
+            self.cards_data = bingo_card_io.load_json(cards_file)
+            self.notify("info", "Success", f"Loaded {len(self.cards_data)} cards from {cards_file}")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load cards data: {str(e)}")
+            self.notify("error", "Error", f"Failed to load cards data: {str(e)}")
 
     def prompt_card_id(self):
-        if not self.cards_data:
-            messagebox.showinfo("Info", "Please load cards data first.")
+        if not self.cards_data and not self.derive:
+            self.notify("info", "Info", "Please load cards data first.")
             return
             
         card_ids = list(self.cards_data.keys())
@@ -289,9 +356,22 @@ class BingoScorer(tk.Tk):
         if card_id:
             self.load_card_by_id(card_id)
 
+    def derive_card(self, card_id):
+        """Rebuild a single card from the seed and question bank, without the JSON"""
+        master_dict, seed, maximize_unique, samplers = self.derive
+        card = bingo_card_generator.derive_bingo_card(master_dict, seed, int(card_id), maximize_unique,
+                                                      samplers=samplers)
+        self.cards_data[card_id] = card
+        return card
+
+    def has_card(self, card_id):
+        return card_id in self.cards_data or bool(self.derive and card_id.isdigit() and int(card_id) > 0)
+
     def load_card_by_id(self, card_id):
+        if card_id not in self.cards_data and self.has_card(card_id):
+            self.derive_card(card_id)
         if card_id not in self.cards_data:
-            messagebox.showerror("Error", f"Card ID {card_id} not found in loaded cards data.")
+            self.notify("error", "Error", f"Card ID {card_id} not found in loaded cards data.")
             return
             
         card_data = self.cards_data[card_id]
@@ -309,7 +389,7 @@ class BingoScorer(tk.Tk):
                 square = self.squares[position]
                 
                 # Update spice level
-                spice_level = data.get("spice_level", "")
+                spice_level = data.get("spice_level") or data.get("category", "")
                 square["spice_level"] = spice_level
                 square["spice_value"].config(text=spice_level.capitalize(), bg=self.get_color_for_spice_level(spice_level))
                 
@@ -320,13 +400,16 @@ class BingoScorer(tk.Tk):
                 square["content_text"].insert(tk.END, content)
                 square["content_text"].config(state="disabled")
         
-        messagebox.showinfo("Success", f"Loaded card {card_id}")
-
-    def save_completions(self):
-        if not self.current_card_id:
-            messagebox.showinfo("Info", "Please load a card first.")
+        if self.rapid:
+            # Pick up where we left off if this card was scored before
+            if os.path.exists(self.completions_filename(card_id)):
+                self.load_completions()
+            else:
+                self.calculate_score()
             return
-            
+        self.notify("info", "Success", f"Loaded card {card_id}")
+
+    def completions_payload(self):
         completions = {
             "card_id": self.current_card_id,
             "level_points": self.level_points,
@@ -338,28 +421,159 @@ class BingoScorer(tk.Tk):
                 "completed": square["completed_var"].get(),
                 "doubled": square["doubled_var"].get()
             }
-        
-        filename = f"completions_{self.current_card_id}.json"
+        return completions
+
+    def completions_filename(self, card_id=None):
+        """completions_<id>.json, compressed the same way as the cards file"""
+        card_id = self.current_card_id if card_id is None else card_id
+        return f"completions_{card_id}.json{bingo_card_io.compression_suffix(self.cards_file)}"
+
+    @staticmethod
+    def write_completions(filename, completions):
+        # Atomic: rapid mode may load the file again while a background save is still running
+        bingo_card_io.dump_json(completions, filename, indent=2, atomic=True)
+
+    def save_completions(self):
+        if not self.current_card_id:
+            self.notify("info", "Info", "Please load a card first.")
+            return
+            
+        filename = self.completions_filename()
         try:
-            with open(filename, "w") as f:
-                json.dump(completions, f, indent=2)
-            messagebox.showinfo("Success", f"Completions saved to {filename}")
+            self.write_completions(filename, self.completions_payload())
+            self.notify("info", "Success", f"Completions saved to {filename}")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save completions: {str(e)}")
+            self.notify("error", "Error", f"Failed to save completions: {str(e)}")
+
+    def save_completions_async(self):
+        """Write the current card's completions on a worker thread; results are reported by poll_saves"""
+        filename = self.completions_filename()
+        completions = self.completions_payload()
+
+        def worker():
+            try:
+                self.write_completions(filename, completions)
+                self.save_results.put((True, filename))
+            except Exception as e:
+                self.save_results.put((False, f"Failed to save {filename}: {str(e)}"))
+
+        # Not a daemon thread, so closing the window never cuts a save short
+        threading.Thread(target=worker).start()
+
+    def poll_saves(self):
+        while True:
+            try:
+                ok, message = self.save_results.get_nowait()
+            except queue.Empty:
+                break
+            if not ok:
+                self.notify("error", "Error", message)
+        self.after(100, self.poll_saves)
+
+    def enable_rapid_entry(self):
+        """Keyboard-only scoring: type an ID, toggle squares with 1-9 / Shift+1-9, Enter to save and advance"""
+        self.card_id_var.trace_add("write", lambda *_: self.on_card_id_typed())
+        self.card_id_entry.bind("<Return>", self.on_card_id_entered)
+        self.card_id_entry.bind("<KP_Enter>", self.on_card_id_entered)
+        self.bind("<Key>", self.on_rapid_key)
+        self.after(100, self.poll_saves)
+        self.card_id_entry.focus_set()
+
+    def focus_card_id_entry(self):
+        self.card_id_entry.focus_set()
+        self.card_id_entry.select_range(0, tk.END)
+
+    def on_card_id_typed(self):
+        card_id = self.card_id_var.get().strip()
+        if card_id == self.current_card_id:
+            return
+        if card_id and self.has_card(card_id):
+            self.load_card_by_id(card_id)
+        elif self.current_card_id:
+            # e.g. "1" loaded while typing "15": the old card must not be scored or saved
+            self.current_card_id = None
+            self.card_id_label.config(text="None")
+
+    def on_card_id_entered(self, event):
+        card_id = self.card_id_var.get().strip()
+        if card_id and card_id == self.current_card_id:
+            self.focus_set()
+        else:
+            self.notify("error", "Error", f"Card ID {card_id} not found.")
+        return "break"
+
+    def rapid_square_index(self, event):
+        """Index of the square (0-8) for a digit key or number pad key, else None"""
+        keycodes = RAPID_DIGIT_KEYCODES.get(self.tk.call("tk", "windowingsystem"))
+        if keycodes is not None and event.keycode in keycodes:
+            return keycodes[event.keycode]
+        keysym = event.keysym[3:] if event.keysym.startswith("KP_") else event.keysym
+        if len(keysym) == 1 and keysym in "123456789":
+            return int(keysym) - 1
+        if keycodes is None:
+            return RAPID_SHIFTED_DIGIT_KEYSYMS.get(keysym)
+        return None
+
+    def on_rapid_key(self, event):
+        if isinstance(event.widget, tk.Entry):
+            return
+        # Digits first: on some layouts Shift+digit types '/' (e.g. Shift+7 on German)
+        index = self.rapid_square_index(event)
+        if index is None and event.keysym in ("Escape", "slash"):
+            self.focus_card_id_entry()
+            return "break"
+        if not self.current_card_id:
+            return
+        if event.keysym in ("Return", "KP_Enter"):
+            self.finish_card()
+            return "break"
+        if index is None:
+            return
+
+        doubled = bool(event.state & 0x1)  # Shift
+        square = self.squares[bingo_card_generator.POSITIONS[index]]
+        if doubled:
+            square["doubled_var"].set(not square["doubled_var"].get())
+            # A doubled square has obviously been signed
+            if square["doubled_var"].get():
+                square["completed_var"].set(True)
+        else:
+            square["completed_var"].set(not square["completed_var"].get())
+        self.calculate_score()
+        return "break"
+
+    def next_card_id(self):
+        if self.derive:
+            return str(int(self.current_card_id) + 1) if self.current_card_id.isdigit() else None
+        card_ids = sorted(self.cards_data, key=lambda x: int(x) if x.isdigit() else float("inf"))
+        position = card_ids.index(self.current_card_id)
+        return card_ids[position + 1] if position + 1 < len(card_ids) else None
+
+    def finish_card(self):
+        """Score and save the current card in the background, then move on to the next one"""
+        self.calculate_score()
+        scored_id, score = self.current_card_id, self.score_label.cget("text")
+        self.save_completions_async()
+
+        next_id = self.next_card_id()
+        if next_id is None:
+            self.notify("info", "Success", f"Card {scored_id}: {score}. That was the last card.")
+            return
+        self.card_id_var.set(next_id)
+        self.notify("info", "Success", f"Card {scored_id}: {score}. Now on card {next_id}.")
 
     def load_completions(self):
         if not self.current_card_id:
-            messagebox.showinfo("Info", "Please load a card first.")
+            self.notify("info", "Info", "Please load a card first.")
             return
             
-        filename = f"completions_{self.current_card_id}.json"
+        filename = self.completions_filename()
         if not os.path.exists(filename):
-            messagebox.showinfo("Info", f"No saved completions found for card {self.current_card_id}.")
+            self.notify("info", "Info", f"No saved completions found for card {self.current_card_id}.")
             return
             
         try:
-            with open(filename, "r") as f:
-                completions = json.load(f)
+            completions = bingo_card_io.load_json(filename)
             
             # Update level points
             for level, points in completions["level_points"].items():
@@ -367,9 +581,7 @@ class BingoScorer(tk.Tk):
                     self.level_points[level] = points
             
             # Update level point entries
-            points_frame = self.header_frame.winfo_children()[-1]
-            for i, level in enumerate(["innocent", "mild", "spicy"]):
-                entry = points_frame.winfo_children()[i*2+2]
+            for level, entry in self.level_entries.items():
                 entry.delete(0, tk.END)
                 entry.insert(0, str(self.level_points[level]))
             
@@ -380,11 +592,44 @@ class BingoScorer(tk.Tk):
                     square["completed_var"].set(data.get("completed", False))
                     square["doubled_var"].set(data.get("doubled", False))
             
-            messagebox.showinfo("Success", f"Loaded completions for card {self.current_card_id}")
+            if not self.rapid:
+                self.notify("info", "Success", f"Loaded completions for card {self.current_card_id}")
             self.calculate_score()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load completions: {str(e)}")
+            self.notify("error", "Error", f"Failed to load completions: {str(e)}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI for scoring completed bingo cards")
+    parser.add_argument('-f', '--file', default='bingo_cards.json',
+                        help='JSON file containing bingo card data (.json.gz, .bz2 or .xz for compressed)')
+    parser.add_argument('--seed', type=int,
+                        help='Rebuild cards made with the generator\'s --derive mode from this seed')
+    parser.add_argument('--questions', nargs=3, type=pathlib.Path, metavar=('file1', 'file2', 'file3'),
+                        default=bingo_card_generator.DEFAULT_QUESTION_FILES,
+                        help='Question bank files the cards were generated from')
+    parser.add_argument('--maximize-unique', action='store_true',
+                        help='The cards were generated with --maximize-unique')
+    parser.add_argument('--patterns', type=pathlib.Path,
+                        help='JSON file with line/pattern bonus points (see bingo_card_patterns.py)')
+    parser.add_argument('--rapid', action='store_true',
+                        help='Keyboard-driven scoring with no pop-ups: ' + RAPID_INSTRUCTIONS)
+    args = parser.parse_args(argv)
+
+    derive = None
+    if args.seed is not None:
+        master_dict = bingo_card_generator.generate_master_dict(args.questions)
+        samplers = bingo_card_generator.load_prompt_weights(args.questions, master_dict)
+        derive = (master_dict, args.seed, args.maximize_unique, samplers)
+
+    patterns = None
+    if args.patterns:
+        try:
+            patterns = bingo_card_patterns.load_patterns(args.patterns)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+    app = BingoScorer(args.file, derive, patterns, rapid=args.rapid)
+    app.mainloop()
 
 if __name__ == "__main__":
-    app = BingoScorer()
-    app.mainloop()
\ No newline at end of file
+    main()
@@ -0,0 +1,312 @@
+"""
+Bingo Card Statistics
+
+Prints a summary of a generated deck of bingo cards: how many cards there are,
+how many distinct prompts they use, how often each prompt appears, and how similar
+the cards are to one another.
+
+SIMILARITY:
+-----------
+Two cards are compared by the prompts they share. The report lists the most
+overlapping pairs, how many pairs share 0, 1, 2, ... prompts, and clusters of
+near-duplicate cards (Jaccard similarity of their prompt sets >= --threshold).
+
+- Decks of up to --exact-limit cards are compared exactly, pair by pair.
+- Larger decks use MinHash signatures with locality-sensitive hashing (LSH) to find
+  candidate pairs, which are then checked exactly. A pair with Jaccard similarity J
+  is found with probability 1 - (1 - J^rows)^bands; the report prints this for the
+  threshold. The shared-prompt distribution is estimated from --samples random pairs
+  and is within the printed margin of the true value with 95% confidence (Hoeffding).
+
+USAGE:
+------
+    python bingo_card_stats.py
+    python bingo_card_stats.py bingo_cards.json --top 10
+    python bingo_card_stats.py big_deck.json --threshold 0.4 --pairs 20
+"""
+
+import argparse
+import hashlib
+import heapq
+import math
+import operator
+import pathlib
+import random
+from collections import Counter, defaultdict
+from itertools import combinations
+
+import bingo_card_io
+
+# Mersenne prime used for the MinHash hash family
+_PRIME = (1 << 61) - 1
+
+
+def load_cards(json_path):
+    """Load the card JSON written by bingo_card_generator.py (optionally compressed)"""
+    return bingo_card_io.load_json(json_path)
+
+
+def prompt_usage(cards):
+    """Count how many cards each prompt appears on, and the category it belongs to"""
+    usage = Counter()
+    categories = {}
+    for card in cards.values():
+        for square in card.values():
+            if square and square.get('content'):
+                usage[square['content']] += 1
+                categories[square['content']] = bingo_card_io.square_category(square) or 'unknown'
+    return usage, categories
+
+
+def card_prompt_sets(cards):
+    """(card ids, prompt sets) in card order"""
+    card_ids = sorted(cards, key=int)
+    prompt_sets = [frozenset(square['content'] for square in cards[card_id].values()
+                             if square and square.get('content'))
+                   for card_id in card_ids]
+    return card_ids, prompt_sets
+
+
+def jaccard(a, b):
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+class SimilarityReport:
+    def __init__(self, exact, pairs, distribution, clusters, threshold, notes=()):
+        self.exact = exact
+        self.pairs = pairs                   # [(shared, jaccard, card_a, card_b)], most similar first
+        self.distribution = distribution     # shared prompt count -> fraction of all pairs
+        self.clusters = clusters             # [[card ids]], largest first
+        self.threshold = threshold
+        self.notes = list(notes)
+
+
+def _clusters(card_ids, similar_pairs):
+    """Group cards connected by near-duplicate pairs (union-find)"""
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in similar_pairs:
+        parent[find(a)] = find(b)
+
+    groups = defaultdict(list)
+    for x in parent:
+        groups[find(x)].append(x)
+    # card_ids are in numeric order, so sorting the indices sorts the IDs as numbers ("9" before "10")
+    clusters = [[card_ids[i] for i in sorted(group)] for group in groups.values() if len(group) > 1]
+    return sorted(clusters, key=lambda c: (-len(c), int(c[0])))
+
+
+def exact_similarity(card_ids, prompt_sets, threshold=0.5, top_pairs=10):
+    """Compare every pair of cards, via an inverted index of prompt -> cards"""
+    cards_with = defaultdict(list)
+    for i, prompts in enumerate(prompt_sets):
+        for prompt in prompts:
+            cards_with[prompt].append(i)
+
+    shared = Counter()
+    for members in cards_with.values():
+        shared.update(combinations(members, 2))
+
+    total_pairs = len(prompt_sets) * (len(prompt_sets) - 1) // 2
+    counts = Counter(shared.values())
+    counts[0] = total_pairs - len(shared)
+    distribution = {k: v / total_pairs for k, v in counts.items() if v} if total_pairs else {}
+
+    scored = [(n, jaccard(prompt_sets[i], prompt_sets[j]), i, j) for (i, j), n in shared.items()]
+    similar = [(i, j) for _, jac, i, j in scored if jac >= threshold]
+    scored = heapq.nsmallest(top_pairs, scored, key=lambda p: (-p[1], -p[0], p[2], p[3]))
+    pairs = [(n, jac, card_ids[i], card_ids[j]) for n, jac, i, j in scored]
+    return SimilarityReport(True, pairs, distribution, _clusters(card_ids, similar), threshold)
+
+
+def _hash_family(num_perm, seed):
+    rng = random.Random(seed)
+    return [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(num_perm)]
+
+
+def minhash_signatures(prompt_sets, num_perm=64, seed=0):
+    """MinHash signature of each prompt set.
+
+    A deck only has a few hundred distinct prompts, so each prompt's num_perm hash
+    values are computed once and a card's signature is their element-wise minimum.
+    """
+    family = _hash_family(num_perm, seed)
+    prompt_hashes = {}
+    signatures = []
+    for prompts in prompt_sets:
+        vectors = []
+        for prompt in prompts:
+            vector = prompt_hashes.get(prompt)
+            if vector is None:
+                x = int.from_bytes(hashlib.blake2b(prompt.encode('utf-8'), digest_size=8).digest(), 'big')
+                vector = prompt_hashes[prompt] = [(a * x + b) % _PRIME for a, b in family]
+            vectors.append(vector)
+        signatures.append(tuple(map(min, *vectors)) if len(vectors) > 1 else tuple(vectors[0]) if vectors else ())
+    return signatures
+
+
+def lsh_candidates(signatures, bands, rows):
+    """Yield each pair of cards whose signatures agree on at least one band, once.
+
+    A pair is only yielded for the first band it collides in, so no set of already
+    seen pairs (which could hold millions of entries) is needed.
+    """
+    band_keys = [[hash(signature[band * rows:(band + 1) * rows]) for band in range(bands)]
+                 for signature in signatures]
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for i, keys in enumerate(band_keys):
+            buckets[keys[band]].append(i)
+        for members in buckets.values():
+            for i, j in combinations(members, 2):
+                if band == 0 or not any(map(operator.eq, band_keys[i][:band], band_keys[j][:band])):
+                    yield i, j
+
+
+def approximate_similarity(card_ids, prompt_sets, threshold=0.5, top_pairs=10,
+                           num_perm=64, bands=16, samples=100_000, seed=0):
+    rows = num_perm // bands
+    signatures = minhash_signatures(prompt_sets, num_perm=bands * rows, seed=seed)
+
+    # Check candidates exactly, keeping only near-duplicates and the running top pairs
+    similar = []
+    top = []
+    floor = -1.0  # Jaccard of the weakest pair in a full top list
+    for i, j in lsh_candidates(signatures, bands, rows):
+        a, b = prompt_sets[i], prompt_sets[j]
+        shared = len(a & b)
+        jac = shared / (len(a) + len(b) - shared)
+        if jac >= threshold:
+            similar.append((i, j))
+        if jac < floor:
+            continue
+        entry = (jac, shared, -i, -j)
+        if len(top) < top_pairs:
+            heapq.heappush(top, entry)
+        elif entry > top[0]:
+            heapq.heapreplace(top, entry)
+        if len(top) == top_pairs:
+            floor = top[0][0]
+    pairs = [(n, jac, card_ids[-i], card_ids[-j]) for jac, n, i, j in sorted(top, reverse=True)]
+
+    # Shared-prompt distribution from uniformly sampled pairs
+    rng = random.Random(seed)
+    n = len(prompt_sets)
+    counts = Counter()
+    for _ in range(samples):
+        i, j = rng.sample(range(n), 2)
+        counts[len(prompt_sets[i] & prompt_sets[j])] += 1
+    distribution = {k: v / samples for k, v in counts.items()}
+
+    margin = math.sqrt(math.log(2 / 0.05) / (2 * samples))
+    recall = 1 - (1 - threshold ** rows) ** bands
+    notes = [
+        f"MinHash with {bands} bands x {rows} rows; pairs at Jaccard {threshold:.2f} "
+        f"are found with probability {recall:.1%}, more similar pairs more often.",
+        f"Shared-prompt fractions estimated from {samples:,} random pairs, "
+        f"each within +/-{margin:.2%} (95% confidence).",
+    ]
+    return SimilarityReport(False, pairs, distribution, _clusters(card_ids, similar), threshold, notes)
+
+
+def card_similarity(cards, threshold=0.5, top_pairs=10, exact_limit=2000, **minhash_options):
+    """Exact for decks of at most exact_limit cards, MinHash/LSH beyond that"""
+    card_ids, prompt_sets = card_prompt_sets(cards)
+    if len(card_ids) <= exact_limit:
+        return exact_similarity(card_ids, prompt_sets, threshold, top_pairs)
+    return approximate_similarity(card_ids, prompt_sets, threshold, top_pairs, **minhash_options)
+
+
+def print_summary(cards, top=5):
+    usage, categories = prompt_usage(cards)
+
+    print(f"Cards: {len(cards)}")
+    print(f"Distinct prompts used: {len(usage)}")
+
+    per_category = Counter()
+    for prompt, count in usage.items():
+        per_category[categories[prompt]] += count
+    for category, count in sorted(per_category.items()):
+        print(f"  {category}: {count} squares")
+
+    if usage:
+        print("\nMost used prompts:")
+        for prompt, count in usage.most_common(top):
+            print(f"  {count:>5}  {prompt}")
+
+
+def print_similarity(report, max_clusters=10, max_cluster_ids=12):
+    print(f"\nCard similarity ({'exact' if report.exact else 'approximate'}):")
+    for note in report.notes:
+        print(f"  {note}")
+
+    print("\nPairs of cards sharing N prompts:")
+    for shared, fraction in sorted(report.distribution.items()):
+        print(f"  {shared:>2}: {fraction:8.3%}")
+
+    if report.pairs:
+        print("\nMost overlapping pairs:")
+        for shared, jac, card_a, card_b in report.pairs:
+            print(f"  cards {card_a} & {card_b}: {shared} shared prompts (Jaccard {jac:.2f})")
+
+    print(f"\nNear-duplicate clusters (Jaccard >= {report.threshold:.2f}): {len(report.clusters)}")
+    for cluster in report.clusters[:max_clusters]:
+        more = f", ... ({len(cluster) - max_cluster_ids} more)" if len(cluster) > max_cluster_ids else ""
+        print(f"  {len(cluster)} cards: {', '.join(cluster[:max_cluster_ids])}{more}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print statistics about a deck of bingo cards")
+    parser.add_argument(
+        'json_file',
+        nargs='?',
+        type=pathlib.Path,
+        default=pathlib.Path('bingo_cards.json'),
+        help='Path to JSON file containing bingo card data'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=5,
+        help='Number of most used prompts to list'
+    )
+    parser.add_argument('--pairs', type=int, default=10,
+                        help='Number of most overlapping card pairs to list')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='Jaccard similarity at which two cards count as near-duplicates')
+    parser.add_argument('--exact-limit', type=int, default=2000,
+                        help='Compare every pair exactly for decks up to this many cards')
+    parser.add_argument('--num-perm', type=int, default=64,
+                        help='MinHash signature length for large decks')
+    parser.add_argument('--bands', type=int, default=16,
+                        help='LSH bands for large decks (signature rows per band = num-perm / bands)')
+    parser.add_argument('--samples', type=int, default=100_000,
+                        help='Random pairs sampled to estimate the shared-prompt distribution of large decks')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the MinHash functions and pair sampling')
+    parser.add_argument('--no-similarity', action='store_true',
+                        help='Skip the card similarity report')
+    args = parser.parse_args(argv)
+
+    if args.bands < 1 or args.num_perm < args.bands:
+        parser.error('--num-perm must be at least --bands, and --bands at least 1')
+
+    cards = load_cards(args.json_file)
+    print_summary(cards, top=args.top)
+    if not args.no_similarity and len(cards) > 1:
+        report = card_similarity(cards, threshold=args.threshold, top_pairs=args.pairs,
+                                 exact_limit=args.exact_limit, num_perm=args.num_perm,
+                                 bands=args.bands, samples=args.samples, seed=args.seed)
+        print_similarity(report)
+
+
+if __name__ == "__main__":
+    main()
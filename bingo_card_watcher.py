@@ -0,0 +1,340 @@
+"""
+Bingo Card Watcher
+
+Watches the question bank and the card JSON while you tweak prompts before an
+event, and keeps the cards and their printable pages up to date without
+rebuilding everything.
+
+HOW IT WORKS:
+-------------
+- Every prompt is indexed to the (card, square) pairs that use it.
+- Rewording a prompt in a question bank file (same line, new text) updates the text
+  on every card that uses it. Only the pages holding those cards are re-rendered.
+  When lines are reworded and added or deleted in the same save, reworded lines are
+  told apart from deleted ones by how similar the old and new text are.
+- Deleting a prompt regenerates just the squares that used it. The replacement is
+  drawn from the same category, avoiding prompts already on that card and favouring
+  the least used ones. Prompts with weight 0 in a .weights.json sidecar are never used.
+  All other squares and cards are left untouched.
+- Editing the card JSON by hand re-renders only the pages whose cards changed.
+- Each page is written to its own PDF (page_0001.pdf, page_0002.pdf, ...) so an
+  unchanged page is never rebuilt.
+
+USAGE:
+------
+    python bingo_card_watcher.py
+    python bingo_card_watcher.py bingo_cards.json --seed 420 -t "Birthday Bingo"
+    python bingo_card_watcher.py --no-pdf      # keep the JSON in sync only
+
+ARGUMENTS:
+----------
+json_file                       Card JSON to keep in sync. Defaults to bingo_cards.json
+--questions file1 file2 file3   Question bank files. Defaults to [innocent|mild|spicy].txt
+-s, --seed S                    Seed for replacement prompts, so re-running gives the same result
+-o, --pages-dir DIR             Where to write page PDFs. Defaults to <json_file>_pages/
+-t, --title, -d, --description  Passed through to the PDF maker
+--interval SECONDS              How often to check for changes. Defaults to 1 second
+--no-pdf                        Do not render pages (no reportlab needed)
+"""
+
+import argparse
+import difflib
+import json
+import pathlib
+import random
+import time
+from collections import defaultdict
+
+import bingo_card_io
+from bingo_card_generator import DEFAULT_QUESTION_FILES, fill_list_from_file, load_prompt_weights
+
+
+# What a half-saved or mistyped card, question or weights file can raise. poll() reports these
+# and keeps watching rather than stopping mid-edit.
+READ_ERRORS = (OSError, ValueError, *bingo_card_io.DECOMPRESSION_ERRORS)
+
+# How alike an old and a new line must be to count as the same prompt reworded
+REWORD_CUTOFF = 0.6
+
+
+def _pair_similar(old_lines, new_lines, cutoff=REWORD_CUTOFF):
+    """Pair old with new lines by text similarity, most similar first. Returns {old: new}."""
+    scored = sorted(((difflib.SequenceMatcher(None, old, new).ratio(), i, j)
+                     for i, old in enumerate(old_lines) for j, new in enumerate(new_lines)),
+                    reverse=True)
+    pairs = {}
+    used_new = set()
+    for ratio, i, j in scored:
+        if ratio < cutoff:
+            break
+        if old_lines[i] not in pairs and j not in used_new:
+            pairs[old_lines[i]] = new_lines[j]
+            used_new.add(j)
+    return pairs
+
+
+def diff_prompts(old_prompts, new_prompts):
+    """Compare two versions of a question bank file.
+
+    Returns (reworded, removed): a mapping of old text -> new text for lines edited
+    in place, and the set of old prompts that no longer exist.
+    """
+    reworded = {}
+    removed = set()
+    matcher = difflib.SequenceMatcher(None, old_prompts, new_prompts, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'replace' and i2 - i1 == j2 - j1:
+            reworded.update(zip(old_prompts[i1:i2], new_prompts[j1:j2]))
+        elif tag == 'replace':
+            # Lines reworded next to lines added or deleted: pair them up by similarity
+            pairs = _pair_similar(old_prompts[i1:i2], new_prompts[j1:j2])
+            reworded.update(pairs)
+            removed.update(p for p in old_prompts[i1:i2] if p not in pairs)
+        elif tag == 'delete':
+            removed.update(old_prompts[i1:i2])
+    # A prompt that moved elsewhere in the file was not really removed
+    removed.difference_update(new_prompts)
+    return reworded, removed
+
+
+class CardWatcher:
+    def __init__(self, cards_path, question_files, pages_dir=None, seed=None,
+                 title=None, description=None, render=True):
+        self.cards_path = pathlib.Path(cards_path)
+        self.question_files = [pathlib.Path(f) for f in question_files]
+        if pages_dir is None:
+            # bingo_cards.json.gz -> bingo_cards_pages
+            stem = self.cards_path.name[:len(self.cards_path.name) - len(bingo_card_io.compression_suffix(cards_path))]
+            pages_dir = self.cards_path.with_name(pathlib.Path(stem).stem + '_pages')
+        self.pages_dir = pathlib.Path(pages_dir)
+        self.seed = seed
+        self.title = title
+        self.description = description
+        self.render = render
+
+        self.bank = {f.stem: fill_list_from_file(f) for f in self.question_files}
+        self.never_picked = {f.stem: self._zero_weight_prompts(f) for f in self.question_files}
+        self.mtimes = {path: self._mtime(path) for path in self.question_files + [self.cards_path]}
+        self.cards = self._read_cards()
+        self.index = self._build_index(self.cards)
+        self.page_fingerprints = {}
+        # Set while the card JSON can't be read (e.g. saved half way); bank changes wait for it
+        self.cards_unreadable = False
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _zero_weight_prompts(self, question_file, prompts=None):
+        """Prompts given weight 0 in the question file's .weights.json sidecar, if it has one"""
+        if prompts is None:
+            prompts = self.bank[question_file.stem]
+        sampler = load_prompt_weights([question_file], {question_file.stem: prompts}).get(question_file.stem)
+        if sampler is None:
+            return set()
+        return {prompt for prompt, weight in zip(sampler.prompts, sampler.weights) if weight == 0}
+
+    def _read_cards(self):
+        return bingo_card_io.load_json(self.cards_path)
+
+    def _write_cards(self):
+        bingo_card_io.dump_json(self.cards, self.cards_path)
+        # Don't react to our own write
+        self.mtimes[self.cards_path] = self._mtime(self.cards_path)
+
+    @staticmethod
+    def _build_index(cards):
+        """prompt -> set of (card_id, position) using it"""
+        index = defaultdict(set)
+        for card_id, card in cards.items():
+            for position, square in card.items():
+                if square and square.get('content'):
+                    index[square['content']].add((card_id, position))
+        return index
+
+    def _card_ids(self):
+        return sorted(self.cards, key=int)
+
+    def _replacement_prompt(self, card_id, position, old_prompt, category):
+        """Pick a new prompt for one square, reproducibly when a seed is given"""
+        card_prompts = {square['content'] for square in self.cards[card_id].values() if square}
+        never_picked = self.never_picked.get(category, set())
+        candidates = [p for p in self.bank.get(category, []) if p not in card_prompts and p not in never_picked]
+        if not candidates:
+            return None
+        least_used = min(len(self.index.get(p, ())) for p in candidates)
+        candidates = [p for p in candidates if len(self.index.get(p, ())) == least_used]
+        rng = random.Random(f"{self.seed}:{card_id}:{position}:{old_prompt}") if self.seed is not None else random
+        return rng.choice(candidates)
+
+    def apply_bank_change(self, question_file):
+        """Update cards after a question bank file changed. Returns the card ids touched."""
+        category = question_file.stem
+        new_prompts = fill_list_from_file(question_file)
+        # Read everything before changing any state, so a bad file leaves the watcher as it was
+        never_picked = self._zero_weight_prompts(question_file, new_prompts)
+        reworded, removed = diff_prompts(self.bank.get(category, []), new_prompts)
+        self.bank[category] = new_prompts
+        self.never_picked[category] = never_picked
+
+        touched = set()
+        for old_text, new_text in reworded.items():
+            for card_id, position in self.index.pop(old_text, set()):
+                self.cards[card_id][position]['content'] = new_text
+                self.index[new_text].add((card_id, position))
+                touched.add(card_id)
+
+        for old_text in removed:
+            for card_id, position in sorted(self.index.get(old_text, ())):
+                square = self.cards[card_id][position]
+                if bingo_card_io.square_category(square) != category:
+                    continue
+                new_text = self._replacement_prompt(card_id, position, old_text, category)
+                if new_text is None:
+                    continue
+                square['content'] = new_text
+                self.index[old_text].discard((card_id, position))
+                self.index[new_text].add((card_id, position))
+                touched.add(card_id)
+            if not self.index.get(old_text):
+                self.index.pop(old_text, None)
+
+        if reworded or removed:
+            print(f"{question_file}: {len(reworded)} reworded, {len(removed)} removed "
+                  f"-> {len(touched)} card(s) updated")
+        return touched
+
+    def apply_cards_change(self):
+        """Reload the card JSON after it was edited. Returns the card ids that differ."""
+        new_cards = self._read_cards()
+        touched = {card_id for card_id in new_cards.keys() | self.cards.keys()
+                   if new_cards.get(card_id) != self.cards.get(card_id)}
+        self.cards = new_cards
+        self.index = self._build_index(new_cards)
+        if touched:
+            print(f"{self.cards_path}: {len(touched)} card(s) changed")
+        return touched
+
+    def render_pages(self, only_cards=None):
+        """Re-render the pages whose two cards changed since they were last rendered"""
+        if not self.render:
+            return
+        # Imported here so the watcher still runs (with --no-pdf) without reportlab
+        import bingo_card_pdf_maker as pdf_maker
+
+        title = self.title or pdf_maker.DEFAULT_TITLE
+        description = self.description or pdf_maker.DEFAULT_DESCRIPTION
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+
+        card_ids = self._card_ids()
+        pages = [card_ids[i:i+2] for i in range(0, len(card_ids), 2)]
+        if only_cards is not None:
+            page_of = {card_id: i // 2 for i, card_id in enumerate(card_ids)}
+            wanted = {page_of[card_id] for card_id in only_cards if card_id in page_of}
+        else:
+            wanted = range(len(pages))
+
+        rendered = 0
+        for page_num in sorted(wanted):
+            page_cards = [self.cards[card_id] for card_id in pages[page_num]]
+            fingerprint = json.dumps([title, description, page_cards], sort_keys=True)
+            if self.page_fingerprints.get(page_num) == fingerprint:
+                continue
+            pdf_maker.validate_bingo_data(dict(zip(pages[page_num], page_cards)))
+            grids = [pdf_maker.convert_card_to_grid(card) for card in page_cards]
+            pdf_maker.build_pdf(grids, str(self.pages_dir / f"page_{page_num + 1:04d}.pdf"), title, description)
+            self.page_fingerprints[page_num] = fingerprint
+            rendered += 1
+
+        # Drop pages left over from a larger deck
+        for page_num in [p for p in self.page_fingerprints if p >= len(pages)]:
+            del self.page_fingerprints[page_num]
+            (self.pages_dir / f"page_{page_num + 1:04d}.pdf").unlink(missing_ok=True)
+
+        if rendered:
+            print(f"Rendered {rendered} page(s) to {self.pages_dir}")
+
+    def poll(self):
+        """Check every watched file once and bring cards and pages up to date"""
+        touched = set()
+        relayout = False
+
+        # Pick up hand edits to the card JSON first, so a bank change below applies on top of them
+        mtime = self._mtime(self.cards_path)
+        if mtime != self.mtimes[self.cards_path] and mtime is not None:
+            self.mtimes[self.cards_path] = mtime
+            old_ids = set(self.cards)
+            try:
+                touched |= self.apply_cards_change()
+            except READ_ERRORS as e:
+                self.cards_unreadable = True
+                print(f"Error reading {self.cards_path}: {e} (fix and save it again, still watching)")
+            else:
+                self.cards_unreadable = False
+                # Adding or removing a card shifts every later page; unchanged pages are still skipped
+                relayout = self.cards.keys() != old_ids
+
+        cards_dirty = False
+        # Writing the cards now would overwrite the edit in progress, so leave bank changes for later
+        for path in self.question_files if not self.cards_unreadable else ():
+            mtime = self._mtime(path)
+            if mtime != self.mtimes[path] and mtime is not None:
+                self.mtimes[path] = mtime
+                try:
+                    changed = self.apply_bank_change(path)
+                except READ_ERRORS as e:
+                    print(f"Error reading {path}: {e} (fix and save it again, still watching)")
+                    continue
+                touched |= changed
+                cards_dirty |= bool(changed)
+
+        if cards_dirty:
+            self._write_cards()
+
+        if relayout:
+            self.render_pages()
+        elif touched:
+            self.render_pages(touched)
+
+    def run(self, interval=1.0):
+        self.render_pages()
+        print(f"Watching {', '.join(map(str, self.question_files))} and {self.cards_path} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(interval)
+                self.poll()
+        except KeyboardInterrupt:
+            print("Stopped watching.")
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Keep bingo cards and their PDF pages in sync with the question bank")
+    parser.add_argument('json_file', nargs='?', type=pathlib.Path, default=pathlib.Path('bingo_cards.json'),
+                        help='Card JSON to keep in sync')
+    parser.add_argument('--questions', nargs=3, type=pathlib.Path, metavar=('file1', 'file2', 'file3'),
+                        default=DEFAULT_QUESTION_FILES)
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                        help='Seed for replacement prompts')
+    parser.add_argument('-o', '--pages-dir', type=pathlib.Path, default=None,
+                        help='Directory for per-page PDFs (defaults to <json_file>_pages/)')
+    parser.add_argument('-t', '--title', help='Custom title for the bingo cards (optional)')
+    parser.add_argument('-d', '--description', help='Custom description/instructions for the bingo cards (optional)')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Seconds between checks for changes')
+    parser.add_argument('--no-pdf', action='store_true',
+                        help='Only keep the card JSON in sync, do not render pages')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    watcher = CardWatcher(args.json_file, args.questions, pages_dir=args.pages_dir, seed=args.seed,
+                          title=args.title, description=args.description, render=not args.no_pdf)
+    watcher.run(args.interval)
+
+
+if __name__ == "__main__":
+    main()